@@ -31,8 +31,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from ..util.compat import DATACLASS_SLOTS
 from .aid import AgentIdentifier
 
 
@@ -50,11 +51,46 @@ def _norm_performative(p: str) -> str:
     return p.strip().upper().replace("_", "-")
 
 
+# --------------------------------------------------------------------------- #
+# _AclMemo
+# --------------------------------------------------------------------------- #
+class _AclMemo:
+    """Per-message caches kept out of the dataclass fields.
+
+    Plain ``__slots__`` on a non-dataclass base, so they never show up in
+    ``fields()``, ``asdict()``, ``repr`` or comparisons.
+    """
+
+    __slots__ = (
+        "_perf_norm",
+        "_protocol_lc",
+        "_ontology_lc",
+        "_language_lc",
+        "_decoded",
+    )
+
+    # Normalized slots as ``(source value, normalized value)``; the cache is
+    # ignored once the slot is reassigned (identity check).
+    _perf_norm: Optional[Tuple[str, str]]
+    _protocol_lc: Optional[Tuple[Optional[str], str]]
+    _ontology_lc: Optional[Tuple[Optional[str], str]]
+    _language_lc: Optional[Tuple[Optional[str], str]]
+    # ``(content, language, decoded)`` filled by ``runtime.content``.
+    _decoded: Optional[Tuple[Any, Optional[str], Any]]
+
+    def __post_init__(self) -> None:
+        self._perf_norm = None
+        self._protocol_lc = None
+        self._ontology_lc = None
+        self._language_lc = None
+        self._decoded = None
+
+
 # --------------------------------------------------------------------------- #
 # AclMessage
 # --------------------------------------------------------------------------- #
-@dataclass
-class AclMessage:
+@dataclass(**DATACLASS_SLOTS)
+class AclMessage(_AclMemo):
     """In-memory string representation of a FIPA-ACL message.
 
     Attributes
@@ -132,7 +168,46 @@ class AclMessage:
     @property
     def performative_upper(self) -> str:
         """Return :py:attr:`performative` normalized per FIPA rules."""
-        return _norm_performative(self.performative)
+        src = self.performative
+        cached = self._perf_norm
+        if cached is not None and cached[0] is src:
+            return cached[1]
+        norm = _norm_performative(src)
+        self._perf_norm = (src, norm)
+        return norm
+
+    @property
+    def protocol_lower(self) -> str:
+        """Return :py:attr:`protocol` lowercased (``""`` when unset)."""
+        src = self.protocol
+        cached = self._protocol_lc
+        if cached is not None and cached[0] is src:
+            return cached[1]
+        low = (src or "").lower()
+        self._protocol_lc = (src, low)
+        return low
+
+    @property
+    def ontology_lower(self) -> str:
+        """Return :py:attr:`ontology` lowercased (``""`` when unset)."""
+        src = self.ontology
+        cached = self._ontology_lc
+        if cached is not None and cached[0] is src:
+            return cached[1]
+        low = (src or "").lower()
+        self._ontology_lc = (src, low)
+        return low
+
+    @property
+    def language_lower(self) -> str:
+        """Return :py:attr:`language` lowercased (``""`` when unset)."""
+        src = self.language
+        cached = self._language_lc
+        if cached is not None and cached[0] is src:
+            return cached[1]
+        low = (src or "").lower()
+        self._language_lc = (src, low)
+        return low
 
     # ------------------------------------------------------------------ #
     # dict-like compatibility layer
@@ -31,11 +31,13 @@ import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 from typing import List
 
+from ..util.compat import DATACLASS_SLOTS
+
 
 # --------------------------------------------------------------------------- #
 # AgentIdentifier
 # --------------------------------------------------------------------------- #
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AgentIdentifier:
     """Agent identity and transport addresses.
 
@@ -27,10 +27,13 @@ It includes XML (de)serialization helpers to interoperate with JADE/FIPA tools.
 
 from __future__ import annotations
 
+import functools
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Tuple
 
+from ..util.compat import DATACLASS_SLOTS
 from .aid import AgentIdentifier
 
 # --------------------------------------------------------------------------- #
@@ -43,7 +46,7 @@ RFC_FMT = "%Y%m%dZ%H%M%S%f"  # JADE uses milliseconds + 'Z'
 # --------------------------------------------------------------------------- #
 # Envelope
 # --------------------------------------------------------------------------- #
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Envelope:
     """Transport envelope for ACL payloads.
 
@@ -152,13 +155,58 @@ class Envelope:
         Assumes the incoming XML follows the JADE/FIPA schema. Missing tags will
         raise ``AttributeError`` or cause conversions to fail; caller should wrap
         this in higher-level validation if needed.
+
+        Parsed fields of texts up to :data:`ENVELOPE_CACHE_MAX_XML` characters
+        are memoized, so redelivered envelopes skip the XML parse; every call
+        still returns new :class:`Envelope` / :class:`AgentIdentifier` objects.
         """
-        root = ET.fromstring(xml)
-        params = root.find("./params")
-        to_id = AgentIdentifier.from_elem(params.find("to"))
-        from_id = AgentIdentifier.from_elem(params.find("from"))
-        acl_rep = params.findtext("acl-representation", "")
-        payload_length = int(params.findtext("payload-length", "0"))
-        date_txt = params.findtext("date", "")
-        date = datetime.strptime(date_txt, RFC_FMT).replace(tzinfo=timezone.utc)
-        return cls(to_id, from_id, date, payload_length, acl_rep)
+        if len(xml) <= ENVELOPE_CACHE_MAX_XML:
+            fields = _parse_envelope_cached(xml)
+        else:
+            fields = _parse_envelope(xml)
+        to_name, to_urls, from_name, from_urls, date, payload_length, acl_rep = fields
+        # Fresh identifiers on every call: cached fields are shared, AIDs are not.
+        return cls(
+            AgentIdentifier(to_name, list(to_urls)),
+            AgentIdentifier(from_name, list(from_urls)),
+            date,
+            payload_length,
+            acl_rep,
+        )
+
+
+# --------------------------------------------------------------------------- #
+# XML parsing helpers
+# --------------------------------------------------------------------------- #
+# Envelope texts up to this many characters have their parsed fields memoized
+# (JADE redelivers identical envelopes after a timeout).
+ENVELOPE_CACHE_MAX_XML = 4096
+ENVELOPE_CACHE_SIZE = 256
+
+_EnvelopeFields = Tuple[str, Tuple[str, ...], str, Tuple[str, ...], datetime, int, str]
+
+
+def _parse_envelope(xml: str) -> _EnvelopeFields:
+    """Parse envelope XML into immutable fields (see :meth:`Envelope.from_xml`)."""
+    root = ET.fromstring(xml)
+    params = root.find("./params")
+    to_id = AgentIdentifier.from_elem(params.find("to"))
+    from_id = AgentIdentifier.from_elem(params.find("from"))
+    acl_rep = params.findtext("acl-representation", "")
+    payload_length = int(params.findtext("payload-length", "0"))
+    date_txt = params.findtext("date", "")
+    date = datetime.strptime(date_txt, RFC_FMT).replace(tzinfo=timezone.utc)
+    return (
+        to_id.name,
+        tuple(to_id.addresses),
+        from_id.name,
+        tuple(from_id.addresses),
+        date,
+        payload_length,
+        acl_rep,
+    )
+
+
+_parse_envelope_cached = functools.lru_cache(maxsize=ENVELOPE_CACHE_SIZE)(
+    _parse_envelope
+)
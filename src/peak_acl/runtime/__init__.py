@@ -13,7 +13,7 @@ from .df_manager import (
 from .dispatcher import Callback, InboundDispatcher
 from .event import Kind, MsgEvent
 from .message_template import MessageTemplate
-from .router import classify_message
+from .router import classify_message, classify_message_async
 from .runtime import CommEndpoint, start_endpoint
 
 __all__ = [
@@ -31,6 +31,7 @@ __all__ = [
     "is_df_failure_msg",
     "extract_search_results",
     "classify_message",
+    "classify_message_async",
     "MsgEvent",
     "Kind",
 ]
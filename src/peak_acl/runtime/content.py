@@ -22,23 +22,49 @@ Helpers to decode the ACL ``content`` slot according to the declared language
 (e.g., ``language = "fipa-sl..."``).
 
 Decoding order:
-  1) Full FIPA-SL grammar (ANTLR)  → rich AST (SLSentence, …)
-  2) Ad-hoc SL0 implementation     → ``sl0.*`` dataclasses
-  3) Original string/bytes/object  → fallback (no decoding)
+  1) Ad-hoc SL0 implementation     → ``sl0.*`` dataclasses / nested lists
+  2) Original string/bytes/object  → fallback (no decoding)
+
+:func:`decode_content_sl` opts into the full FIPA-SL grammar first (rich AST:
+``SLSentence``, …) and falls back to the order above.
 
 Public API
 ----------
 - :func:`decode_content`
+- :func:`decode_content_sl`
+- :func:`try_decode_content`
+- :func:`decode_content_async`
 """
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import re
+from concurrent.futures import Executor
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 
 from ..message.acl import AclMessage
 from ..sl import sl0
-from ..sl.sl_parser import parse
-from ..sl.sl_visitor import build_ast
+from ..sl.sl_parser_fast import try_parse_fast
+
+# Below this many characters, decoding inline is cheaper than a thread hop.
+OFFLOAD_MIN_SIZE = 4096
+
+# Distinct SL bodies whose parse is memoized (see ``_read_sl``); longer
+# bodies are parsed every time so the cache cannot pin large payloads.
+DECODE_CACHE_SIZE = 1024
+DECODE_CACHE_MAX_TEXT = 4096
+
+_UNDECODED = object()  # sentinel: no decoder accepted the text
+
+# Heads that ``sl0`` maps onto dataclasses (optionally wrapped, as DF replies
+# are: ``((done ...))``); :func:`decode_content_sl` leaves those to ``sl0``.
+_SL0_HEAD_RE = re.compile(
+    r"\(+\s*(?:action|register|deregister|modify|search|done|failure|result"
+    r"|df-agent-description|service-description|agent-identifier)(?=[\s()]|$)",
+    re.IGNORECASE,
+)
 
 
 # --------------------------------------------------------------------------- #
@@ -50,9 +76,11 @@ def decode_content(msg: AclMessage) -> Any:
     The function inspects ``msg.language`` and, if it starts with ``"fipa-sl"``,
     tries to parse the content as follows:
 
-    1. **Full FIPA-SL via ANTLR** – returns the AST created by ``build_ast``.
-    2. **SL0 compatibility layer** – returns objects from ``sl0`` module.
-    3. **Fallback** – returns the original ``msg.content`` unchanged.
+    1. **SL0 compatibility layer** – returns objects from ``sl0`` module
+       (dataclasses for SL0 vocabulary, nested lists otherwise).
+    2. **Fallback** – returns the original ``msg.content`` unchanged.
+
+    Use :func:`decode_content_sl` for the rich FIPA-SL AST.
 
     Parameters
     ----------
@@ -66,30 +94,126 @@ def decode_content(msg: AclMessage) -> Any:
 
     Notes
     -----
-    * Any parsing error is swallowed intentionally; the next strategy is tried.
+    * When ``sl0`` rejects the text (``ValueError``), the raw content is
+      returned.
     * If ``content`` is not a ``str`` or the language is not SL, the original
       value is returned unchanged.
+    * Parses of bodies up to :data:`DECODE_CACHE_MAX_TEXT` characters are
+      memoized (last :data:`DECODE_CACHE_SIZE` bodies); each message still
+      gets its own decoded objects. ``_read_sl.cache_info()`` reports the hit
+      rate.
+    * The result is also kept on the message itself, so classifying and then
+      extracting the same reply decodes it once; reassigning ``content`` or
+      ``language`` invalidates it.
     """
     txt = msg.content
-    if not (
-        isinstance(txt, str)
-        and msg.language
-        and msg.language.lower().startswith("fipa-sl")
-    ):
+    lang = msg.language
+    cached = msg._decoded
+    if cached is not None and cached[0] is txt and cached[1] is lang:
+        return cached[2]
+    if not (isinstance(txt, str) and msg.language_lower.startswith("fipa-sl")):
         return txt  # Not SL → return as-is
 
     clean = txt.strip()
     if not (clean.startswith("(") and clean.endswith(")")):
         return txt  # Unexpected format
 
-    # 1) Full grammar (ANTLR) -------------------------------------------- #
+    decoded = _decode_sl(clean)
+    # 2) Raw fallback ---------------------------------------------------- #
+    if decoded is _UNDECODED:
+        decoded = txt
+    msg._decoded = (txt, lang, decoded)
+    return decoded
+
+
+def decode_content_sl(msg: AclMessage) -> Any:
+    """Like :func:`decode_content`, but try the full FIPA-SL grammar first.
+
+    SL text is parsed by :func:`~peak_acl.sl.sl_parser_fast.try_parse_fast`
+    into an :class:`~peak_acl.sl.sl_visitor.SLSentence`. SL0 vocabulary
+    (``done``, ``result``, ``action``, …) and text that parser rejects are
+    decoded by :func:`decode_content` instead.
+    """
+    txt = msg.content
+    if isinstance(txt, str) and msg.language_lower.startswith("fipa-sl"):
+        clean = txt.strip()
+        if _SL0_HEAD_RE.match(clean) is None:
+            sentence = try_parse_fast(clean)
+            if sentence is not None:
+                return sentence
+    return decode_content(msg)
+
+
+def try_decode_content(msg: AclMessage) -> Tuple[bool, Any]:
+    """Like :func:`decode_content`, but report failures instead of raising.
+
+    Returns
+    -------
+    tuple[bool, Any]
+        ``(True, payload)`` on success, ``(False, exc)`` if decoding raised.
+
+    Notes
+    -----
+    Malformed SL does not raise to begin with (the decoders reject it and the
+    raw text is returned), and neither does pathologically nested input; this
+    only guards unexpected errors.
+    """
+    try:
+        return True, decode_content(msg)
+    except Exception as exc:
+        return False, exc
+
+
+def _decode_sl(clean: str) -> Any:
+    """Decode stripped SL text, or return ``_UNDECODED`` if ``sl0`` rejects it.
+
+    Every call builds new objects from the parsed form (memoized by
+    :func:`_read_sl` up to :data:`DECODE_CACHE_MAX_TEXT` characters), so
+    callers may mutate what they get back.
+
+    The parser and builder are iterative, but turning pathologically nested
+    terms into text (``str`` of a nested list, ``repr``) still recurses; such
+    content counts as undecodable rather than escaping as ``RecursionError``.
+    """
+    if len(clean) <= DECODE_CACHE_MAX_TEXT:
+        form = _read_sl(clean)
+    else:
+        form = _parse_sl(clean)
+    if form is _UNDECODED:
+        return _UNDECODED
+    try:
+        return sl0.build_ast(form)  # the builders validate slots as well
+    except (ValueError, RecursionError):
+        return _UNDECODED
+
+
+def _parse_sl(clean: str) -> Any:
+    """Return the ``sl0`` nested-list form of *clean*, or ``_UNDECODED``."""
     try:
-        tree = parse(clean)  # ANTLR parse-tree
-        return build_ast(tree)  # Rich AST (SLSentence, …)
-    except Exception:
-        # 2) SL0 compatibility ------------------------------------------- #
-        try:
-            return sl0.loads(clean)
-        except Exception:
-            # 3) Raw fallback -------------------------------------------- #
-            return txt
+        return sl0.parse_sexpr(clean)
+    except (ValueError, RecursionError):
+        return _UNDECODED
+
+
+# Memoized :func:`_parse_sl`. The cached lists are only ever read (by
+# ``sl0.build_ast``), never handed out, so sharing them is safe.
+_read_sl = lru_cache(maxsize=DECODE_CACHE_SIZE)(_parse_sl)
+
+
+# --------------------------------------------------------------------------- #
+# decode_content_async
+# --------------------------------------------------------------------------- #
+async def decode_content_async(
+    msg: AclMessage, *, executor: Optional[Executor] = None
+) -> Any:
+    """Async variant of :func:`decode_content` that keeps the loop responsive.
+
+    Payloads of at least :data:`OFFLOAD_MIN_SIZE` characters are decoded in
+    *executor* (the loop's default one if ``None``); smaller payloads are
+    decoded inline, since the thread hop would cost more than the parse.
+    """
+    txt = msg.content
+    if not isinstance(txt, str) or len(txt) < OFFLOAD_MIN_SIZE:
+        return decode_content(msg)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, decode_content, msg)
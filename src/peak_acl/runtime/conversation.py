@@ -35,28 +35,43 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import secrets
+import math
+import os
 from dataclasses import dataclass, field
 from functools import partial
-from typing import Awaitable, Callable, Dict, Optional
+from typing import Awaitable, Callable, Dict, List, Optional
 
 from ..message.acl import AclMessage
 from ..message.aid import AgentIdentifier
 from ..sl import sl0  # serialize SL0 payloads
+from ..util.compat import DATACLASS_SLOTS
 
 _log = logging.getLogger("peak_acl.conversation")
 
+# Timeouts are grouped into buckets this many seconds wide; each bucket arms a
+# single loop timer. A conversation may time out up to this much late.
+TIMER_RESOLUTION = 0.1
+
+# Conversation states: pending → {agreed|refused} → done
+_PENDING, _AGREED, _REFUSED, _DONE = range(4)
+
+_FINAL_REPLIES = frozenset(("INFORM", "FAILURE"))
+
 
 # ---------------------------------------------------------------------- #
 # Conversation state container
 # ---------------------------------------------------------------------- #
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class _Conversation:
-    """Internal state holder for a single conversation."""
+    """Internal state holder for a single conversation.
+
+    ``request_msg`` is only kept until the first reply arrives; the whole
+    record is dropped once the conversation ends.
+    """
 
     conv_id: str
     future: asyncio.Future
-    state: str = "pending"  # pending → {agreed|refused} → done
+    state: int = _PENDING
     request_msg: AclMessage | None = None
     reply_agree_refuse: AclMessage | None = None
 
@@ -77,6 +92,8 @@ class ConversationManager:
         """
         self._convs: Dict[str, _Conversation] = {}
         self._send_fn = send_fn
+        # bucket index -> conversation ids expiring when that bucket fires
+        self._timeouts: Dict[int, List[str]] = {}
 
     # ------------------------------------------------------------------ #
     async def send_request(
@@ -105,7 +122,8 @@ class ConversationManager:
             Transport destination, passed to ``send_fn``.
         timeout :
             Optional seconds to auto-timeout the conversation; if elapsed,
-            the future is completed with ``asyncio.TimeoutError``.
+            the future is completed with ``asyncio.TimeoutError`` (rounded
+            up to :data:`TIMER_RESOLUTION`).
 
         Returns
         -------
@@ -117,7 +135,8 @@ class ConversationManager:
         Notes
         -----
         * Conversation ID is generated via `_gen_conv_id()`.
-        * The future is stored in ``_convs`` until completion or timeout.
+        * The future is stored in ``_convs`` until completion, timeout or
+          cancellation.
         """
         conv_id = _gen_conv_id(sender)
 
@@ -140,13 +159,18 @@ class ConversationManager:
         fut: asyncio.Future = loop.create_future()
         conv = _Conversation(conv_id, fut, request_msg=req)
         self._convs[conv_id] = conv
+        # Drops the record however the future ends, including cancellation
+        # by the caller (e.g. ``asyncio.wait_for`` timing out).
+        fut.add_done_callback(partial(self._forget, conv_id))
 
-        # Auto-remove when done (prevents memory leaks on normal completion)
-        fut.add_done_callback(lambda f, cid=conv_id: self._convs.pop(cid, None))
-
-        # Optional timeout scheduling
+        # Optional timeout scheduling (one timer per bucket)
         if timeout is not None and timeout > 0:
-            loop.call_later(timeout, partial(self._on_timeout, conv_id))
+            slot = math.ceil((loop.time() + timeout) / TIMER_RESOLUTION)
+            bucket = self._timeouts.get(slot)
+            if bucket is None:
+                bucket = self._timeouts[slot] = []
+                loop.call_at(slot * TIMER_RESOLUTION, self._expire_bucket, slot)
+            bucket.append(conv_id)
 
         await self._send_fn(req, url)  # fire REQUEST
         return fut  # await fut → AclMessage
@@ -161,42 +185,55 @@ class ConversationManager:
             Incoming message to be matched against tracked conversations.
         """
         cid = acl.conversation_id
-        if not cid or cid not in self._convs:
+        conv = self._convs.get(cid)  # type: ignore[arg-type]
+        if conv is None:
+            return
+        if conv.future.done():
+            # Cancelled by the caller -> nobody is waiting for the reply
+            del self._convs[cid]
             return
-
-        conv = self._convs[cid]
         perf = acl.performative_upper
 
         # 1st reply -> AGREE or REFUSE
-        if conv.state == "pending":
-            if perf in {"AGREE", "REFUSE"}:
+        if conv.state == _PENDING:
+            if perf == "AGREE":
+                conv.request_msg = None  # answered -> release the request
                 conv.reply_agree_refuse = acl
-                conv.state = "agreed" if perf == "AGREE" else "refused"
-                if perf == "REFUSE" and not conv.future.done():
-                    conv.future.set_result(acl)
-                    # REFUSE is terminal -> drop conversation
-                    self._convs.pop(cid, None)
+                conv.state = _AGREED
+            elif perf == "REFUSE":
+                # REFUSE is terminal -> resolve and drop conversation
+                conv.state = _REFUSED
+                conv.future.set_result(acl)
+                del self._convs[cid]
             return
 
-        # 2nd reply -> INFORM/FAILURE (or after REFUSE there's nothing else)
-        if conv.state in {"agreed", "refused"}:
-            if perf in {"INFORM", "FAILURE"}:
-                if not conv.future.done():
-                    conv.future.set_result(acl)
-                conv.state = "done"
-                del self._convs[cid]
+        # 2nd reply -> INFORM/FAILURE (REFUSE already dropped the conversation)
+        if conv.state == _AGREED and perf in _FINAL_REPLIES:
+            conv.future.set_result(acl)
+            conv.state = _DONE
+            del self._convs[cid]
+
+    # ------------------------------------------------------------------ #
+    def _forget(self, conv_id: str, _fut: asyncio.Future) -> None:
+        """Internal: future done-callback that drops the conversation."""
+        self._convs.pop(conv_id, None)
+
+    # ------------------------------------------------------------------ #
+    def _expire_bucket(self, slot: int) -> None:
+        """Internal: time out every conversation registered in *slot*."""
+        for conv_id in self._timeouts.pop(slot, ()):
+            self._on_timeout(conv_id)
 
     # ------------------------------------------------------------------ #
     def _on_timeout(self, conv_id: str) -> None:
         """Internal: mark a conversation as timed out (if still pending)."""
-        conv = self._convs.get(conv_id)
+        conv = self._convs.pop(conv_id, None)
         if not conv:
             return
         if not conv.future.done():
             conv.future.set_exception(
                 asyncio.TimeoutError(f"Conversation {conv_id} timed out")
             )
-        # Future done-callback will remove it from the dict
 
 
 # ---------------------------------------------------------------------- #
@@ -204,5 +241,6 @@ class ConversationManager:
 # ---------------------------------------------------------------------- #
 def _gen_conv_id(sender: AgentIdentifier) -> str:
     """Generate a unique conversation id using the sender name + random hex."""
-    rnd = secrets.token_hex(8)
-    return f"{sender.name}{rnd}"
+    # 8 random bytes from the OS CSPRNG (what secrets.token_hex(8) draws),
+    # hex-encoded with a single C call.
+    return f"{sender.name}{os.urandom(8).hex()}"
@@ -36,6 +36,7 @@ The module builds SL0/FIPA-AM compliant payloads, sends them via an
 
 from __future__ import annotations
 
+import re
 from typing import Iterable, List, Optional, Sequence, Tuple, Union
 
 from ..message.acl import AclMessage
@@ -55,6 +56,16 @@ __all__ = [
 ]
 
 
+# SL0 text of ``Action(df, Deregister(DfAgentDescription(name=me)))``; only
+# the two AIDs vary, so the AST is not rebuilt per call.
+_DEREGISTER_TMPL = "(action {actor} (deregister (df-agent-description :name {name})))"
+
+# Only text whose (possibly wrapped) head is ``done``/``failure`` can decode to
+# sl0.Done/sl0.Failure; anything else is rejected without decoding.
+_DONE_HEAD_RE = re.compile(r"\s*(?:\(\s*)+done(?=[\s()]|$)", re.IGNORECASE)
+_FAILURE_HEAD_RE = re.compile(r"\s*(?:\(\s*)+failure(?=[\s()]|$)", re.IGNORECASE)
+
+
 # ------------------------------------------------------------------ #
 # util
 # ------------------------------------------------------------------ #
@@ -65,6 +76,21 @@ def _first_url(ai: AgentIdentifier) -> str:
     return ai.addresses[0]
 
 
+def _df_request(
+    my_aid: AgentIdentifier, df_aid: AgentIdentifier, content: str
+) -> AclMessage:
+    """Build the FIPA-Request/SL0 message every DF action is wrapped in."""
+    return AclMessage(
+        "request",
+        sender=my_aid,
+        receivers=[df_aid],
+        content=content,
+        language="fipa-sl0",
+        ontology="FIPA-Agent-Management",
+        protocol="fipa-request",
+    )
+
+
 def _coerce_services(
     raw: Iterable[Union[Tuple[str, str], fipa_am.ServiceDescription]],
 ) -> list[fipa_am.ServiceDescription]:
@@ -109,15 +135,7 @@ async def register(
         ownership=ownership,
     )
     content = fipa_am.render_register_content(df_aid, ad)
-    msg = AclMessage(
-        performative="request",
-        sender=my_aid,
-        receivers=[df_aid],
-        content=content,
-        language="fipa-sl0",
-        ontology="FIPA-Agent-Management",
-        protocol="fipa-request",
-    )
+    msg = _df_request(my_aid, df_aid, content)
     await http_client.send(df_aid, my_aid, msg, df_url or _first_url(df_aid))
     return msg
 
@@ -130,19 +148,8 @@ async def deregister(
     df_url: Optional[str] = None,
 ) -> AclMessage:
     """Send a DF DEREGISTER request and return the request message."""
-    inner = sl0.Action(
-        actor=df_aid,
-        act=sl0.Deregister(sl0.DfAgentDescription(name=my_aid)),
-    )
-    msg = AclMessage(
-        performative="request",
-        sender=my_aid,
-        receivers=[df_aid],
-        content=sl0.dumps(inner),
-        language="fipa-sl0",
-        ontology="FIPA-Agent-Management",
-        protocol="fipa-request",
-    )
+    content = _DEREGISTER_TMPL.format(actor=sl0.dumps(df_aid), name=sl0.dumps(my_aid))
+    msg = _df_request(my_aid, df_aid, content)
     await http_client.send(df_aid, my_aid, msg, df_url or _first_url(df_aid))
     return msg
 
@@ -164,36 +171,31 @@ async def search_services(
     ``(search-constraints :max-results X)``. If ``max_results`` is ``None``,
     use ``-1`` (unlimited).
     """
-    # build services (template)
-    svc_bits = []
-    if service_name is not None:
-        svc_bits.append(f":name {service_name}")
-    if service_type is not None:
-        svc_bits.append(f":type {service_type}")
-    svc_part = ""
-    if svc_bits:
-        svc_part = f":services (set (service-description {' '.join(svc_bits)}))"
+    df_addr = _first_url(df_aid)
+    parts = [
+        "((action (agent-identifier :name ",
+        df_aid.name,
+        " :addresses (sequence ",
+        df_addr,
+        ")) (search (df-agent-description ",
+    ]
+
+    # services (template)
+    if service_name is not None or service_type is not None:
+        parts.append(":services (set (service-description")
+        if service_name is not None:
+            parts += (" :name ", service_name)
+        if service_type is not None:
+            parts += (" :type ", service_type)
+        parts.append("))")
 
     # constraints
     mr = -1 if max_results is None else max_results
-    constraints_part = f"(search-constraints :max-results {mr})"
-
-    content = (
-        f"((action (agent-identifier :name {df_aid.name} "
-        f":addresses (sequence {_first_url(df_aid)})) "
-        f"(search (df-agent-description {svc_part}) {constraints_part})))"
-    )
+    parts += (") (search-constraints :max-results ", str(mr), "))))")
+    content = "".join(parts)
 
-    msg = AclMessage(
-        performative="request",
-        sender=my_aid,
-        receivers=[df_aid],
-        content=content,
-        language="fipa-sl0",
-        ontology="FIPA-Agent-Management",
-        protocol="fipa-request",
-    )
-    await http_client.send(df_aid, my_aid, msg, df_url or _first_url(df_aid))
+    msg = _df_request(my_aid, df_aid, content)
+    await http_client.send(df_aid, my_aid, msg, df_url or df_addr)
     return msg
 
 
@@ -209,11 +211,7 @@ def decode_df_reply(msg: AclMessage):
     sl0.Done | sl0.Failure | list[AgentDescription] | Any
         Parsed object(s) or the raw payload if decoding fails.
     """
-    payload = decode_content(msg)
-
-    # Unwrap ContentElementList [(...)] → (...)
-    while isinstance(payload, list) and len(payload) == 1:
-        payload = payload[0]
+    payload = _unwrap(decode_content(msg))
 
     if isinstance(payload, str):
         return payload
@@ -232,8 +230,6 @@ def decode_df_reply(msg: AclMessage):
         ads = []
         for it in payload:
             if isinstance(it, sl0.DfAgentDescription):
-                from ..sl import fipa_am
-
                 ads.append(fipa_am.from_sl0(it))  # type: ignore[arg-type]
         if ads:
             return ads
@@ -241,18 +237,29 @@ def decode_df_reply(msg: AclMessage):
     return payload
 
 
+def _unwrap(payload):
+    """Unwrap a ContentElementList ``[(...)]`` into ``(...)``."""
+    while isinstance(payload, list) and len(payload) == 1:
+        payload = payload[0]
+    return payload
+
+
 def is_df_done_msg(msg: AclMessage) -> bool:
     """Return True if the DF reply decodes to an ``sl0.Done``."""
-    from ..sl import sl0 as _sl0
-
-    return isinstance(decode_df_reply(msg), _sl0.Done)
+    txt = msg.content
+    if isinstance(txt, str) and not _DONE_HEAD_RE.match(txt):
+        return False
+    # Done/Failure are returned unchanged by decode_df_reply; skip its
+    # search-result extraction.
+    return isinstance(_unwrap(decode_content(msg)), sl0.Done)
 
 
 def is_df_failure_msg(msg: AclMessage) -> bool:
     """Return True if the DF reply decodes to an ``sl0.Failure``."""
-    from ..sl import sl0 as _sl0
-
-    return isinstance(decode_df_reply(msg), _sl0.Failure)
+    txt = msg.content
+    if isinstance(txt, str) and not _FAILURE_HEAD_RE.match(txt):
+        return False
+    return isinstance(_unwrap(decode_content(msg)), sl0.Failure)
 
 
 def extract_search_results(msg: AclMessage) -> List[fipa_am.AgentDescription]:
@@ -275,11 +282,9 @@ def extract_search_results_from_value(
     * Lists like ``['set', dfad, ...]`` or plain lists
     * Raw parsed lists where we rebuild AST nodes
     """
-    from ..sl import sl0 as _sl0
-
     ads: List[fipa_am.AgentDescription] = []
 
-    if isinstance(val, _sl0.DfAgentDescription):
+    if isinstance(val, sl0.DfAgentDescription):
         ads.append(fipa_am.from_sl0(val))  # type: ignore[arg-type]
         return ads
 
@@ -290,18 +295,22 @@ def extract_search_results_from_value(
             if val and isinstance(val[0], str) and val[0].lower() == "set"
             else val
         )
+        dfad_cls = sl0.DfAgentDescription
+        build_ast = sl0.build_ast  # pyright: ignore [reportPrivateUsage]
+        from_sl0 = fipa_am.from_sl0
+        append = ads.append
         for it in items:
             # already a DfAgentDescription?
-            if isinstance(it, _sl0.DfAgentDescription):
-                ads.append(fipa_am.from_sl0(it))  # type: ignore[arg-type]
-            else:
-                # try to rebuild AST and convert
-                try:
-                    obj = _sl0.build_ast(it)  # pyright: ignore [reportPrivateUsage]
-                    if isinstance(obj, _sl0.DfAgentDescription):
-                        ads.append(fipa_am.from_sl0(obj))  # type: ignore[arg-type]
-                except Exception:
-                    pass
+            if isinstance(it, dfad_cls):
+                append(from_sl0(it))  # type: ignore[arg-type]
+                continue
+            # try to rebuild AST and convert
+            try:
+                obj = build_ast(it)
+                if isinstance(obj, dfad_cls):
+                    append(from_sl0(obj))  # type: ignore[arg-type]
+            except Exception:
+                pass
         return ads if ads else None
 
     return None
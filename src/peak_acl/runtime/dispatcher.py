@@ -21,14 +21,19 @@ InboundDispatcher – routes inbound ACL messages to callbacks registered
 with a :class:`MessageTemplate`.
 
 It stores (template, callback) pairs and, on dispatch, finds the first match,
-schedules the callback with ``asyncio.create_task`` and returns ``True``.
+schedules the callback on the running loop (``create_task``) and returns
+``True``.
 If nothing matches, it returns ``False``.
+
+Rules are indexed by their ``(performative, protocol, ontology)`` key, with
+``None`` for fields the template leaves open, so dispatch costs one dict
+lookup per distinct key shape (at most 8) instead of one ``match`` per rule.
 """
 
 from __future__ import annotations
 
 import asyncio
-from typing import Awaitable, Callable, List, Tuple
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
 from ..message.acl import AclMessage
 from ..message.aid import AgentIdentifier
@@ -37,6 +42,8 @@ from .message_template import MessageTemplate
 # Signature of registered callbacks
 Callback = Callable[[AgentIdentifier, AclMessage], Awaitable[None]]
 
+_Key = Tuple[Optional[str], Optional[str], Optional[str]]
+
 
 # --------------------------------------------------------------------------- #
 # InboundDispatcher
@@ -47,10 +54,20 @@ class InboundDispatcher:
     def __init__(self) -> None:
         # List of (template, callback) pairs; first match wins.
         self._rules: List[Tuple[MessageTemplate, Callback]] = []
+        # Template key -> (registration index, callback) of its first rule.
+        self._index: Dict[_Key, Tuple[int, Callback]] = {}
+        # Distinct (has performative, has protocol, has ontology) shapes.
+        self._shapes: List[Tuple[bool, bool, bool]] = []
 
     # ----------------------------------------------------------- #
     def add(self, tmpl: MessageTemplate, cb: Callback) -> None:
         """Register a new handler rule."""
+        key = tmpl.key
+        shape = (key[0] is not None, key[1] is not None, key[2] is not None)
+        if shape not in self._shapes:
+            self._shapes.append(shape)
+        # Later rules with an identical key can never win: keep the first.
+        self._index.setdefault(key, (len(self._rules), cb))
         self._rules.append((tmpl, cb))
 
     # ----------------------------------------------------------- #
@@ -75,9 +92,26 @@ class InboundDispatcher:
           logged only if the callback handles them or the event loop has a
           task exception handler.
         * Rule order matters: the first matching template is chosen.
+        * Callbacks are scheduled on the loop running this dispatch.
         """
-        for tmpl, cb in self._rules:
-            if tmpl.match(acl):
-                asyncio.create_task(cb(sender, acl))
-                return True
-        return False
+        perf = acl.performative_upper
+        proto = acl.protocol_lower
+        ont = acl.ontology_lower
+
+        index = self._index
+        best: Optional[Tuple[int, Callback]] = None
+        for has_perf, has_proto, has_ont in self._shapes:
+            hit = index.get(
+                (
+                    perf if has_perf else None,
+                    proto if has_proto else None,
+                    ont if has_ont else None,
+                )
+            )
+            if hit is not None and (best is None or hit[0] < best[0]):
+                best = hit
+
+        if best is None:
+            return False
+        asyncio.get_running_loop().create_task(best[1](sender, acl))
+        return True
@@ -34,6 +34,7 @@ from typing import Any, Literal
 from ..message.acl import AclMessage
 from ..message.aid import AgentIdentifier
 from ..message.envelope import Envelope
+from ..util.compat import DATACLASS_SLOTS
 
 # --------------------------------------------------------------------------- #
 # Kind discriminator for runtime-classified messages.
@@ -52,7 +53,7 @@ Kind = Literal[
 # --------------------------------------------------------------------------- #
 # MsgEvent
 # --------------------------------------------------------------------------- #
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MsgEvent:
     """Runtime-classified message wrapper.
 
@@ -24,10 +24,12 @@ Allows matching over ``performative``, ``protocol`` and ``ontology`` fields.
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Optional
 
 from ..message.acl import AclMessage
 
+_Matcher = Callable[[AclMessage], bool]
+
 
 # --------------------------------------------------------------------------- #
 # MessageTemplate
@@ -47,10 +49,14 @@ class MessageTemplate:
     Notes
     -----
     * Uses ``__slots__`` to avoid per-instance ``__dict__`` (slightly lighter).
+    * :py:attr:`key` is the ``(performative, protocol, ontology)`` tuple, with
+      ``None`` for unconstrained fields (used by the dispatcher's index).
     * Only fields explicitly provided are checked; missing ones are ignored.
+      The predicate is specialized once, at construction, so :meth:`match`
+      never re-tests fields the template leaves open.
     """
 
-    __slots__ = ("performative", "protocol", "ontology")
+    __slots__ = ("performative", "protocol", "ontology", "key", "_match")
 
     def __init__(
         self,
@@ -62,14 +68,32 @@ class MessageTemplate:
         self.performative = performative.upper() if performative else None
         self.protocol = protocol.lower() if protocol else None
         self.ontology = ontology.lower() if ontology else None
+        self.key = (self.performative, self.protocol, self.ontology)
+        self._match = _compile_matcher(*self.key)
 
     # --------------------------------------------------------------- #
     def match(self, acl: AclMessage) -> bool:
         """Return ``True`` if *acl* matches all defined template fields."""
-        if self.performative and acl.performative_upper != self.performative:
-            return False
-        if self.protocol and (acl.protocol or "").lower() != self.protocol:
-            return False
-        if self.ontology and (acl.ontology or "").lower() != self.ontology:
-            return False
-        return True
+        return self._match(acl)
+
+
+# --------------------------------------------------------------------------- #
+# Helpers
+# --------------------------------------------------------------------------- #
+def _compile_matcher(
+    perf: Optional[str], proto: Optional[str], ont: Optional[str]
+) -> _Matcher:
+    """Build a predicate testing only the constrained (non-``None``) fields."""
+    tests: list[_Matcher] = []
+    if perf:
+        tests.append(lambda acl: acl.performative_upper == perf)
+    if proto:
+        tests.append(lambda acl: acl.protocol_lower == proto)
+    if ont:
+        tests.append(lambda acl: acl.ontology_lower == ont)
+
+    if not tests:
+        return lambda acl: True
+    if len(tests) == 1:
+        return tests[0]
+    return lambda acl: all(test(acl) for test in tests)
@@ -25,11 +25,16 @@ Centralizes logic to:
 * Distinguish DF vs. external senders
 * Decode SL0 payloads
 * Use :func:`df_manager.decode_df_reply` for DF replies
+
+:func:`classify_message_async` runs the same logic off the event loop for
+large payloads.
 """
 
 from __future__ import annotations
 
-from typing import Any, Tuple
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Dict, Optional, Tuple
 
 from ..message.acl import AclMessage
 from ..message.aid import AgentIdentifier
@@ -39,6 +44,13 @@ from . import content as content_utils
 from . import df_manager
 from .event import Kind
 
+# Exact payload type of a decoded DF reply -> kind (anything else is "df").
+_DF_REPLY_KINDS: Dict[type, Kind] = {
+    sl0.Done: "df-done",
+    sl0.Failure: "df-failure",
+    list: "df-result",  # list[AgentDescription]
+}
+
 
 # --------------------------------------------------------------------------- #
 # classify_message
@@ -82,29 +94,39 @@ def classify_message(
             return "df-not-understood", acl.get("content", "<sem content>")
 
         payload = df_manager.decode_df_reply(acl)
-
-        if isinstance(payload, sl0.Done):
-            return "df-done", payload
-
-        if isinstance(payload, sl0.Failure):
-            return "df-failure", payload
-
-        if isinstance(payload, list):  # list[AgentDescription]
-            return "df-result", payload
-
-        # Generic fallback
-        return "df", payload
+        # Generic fallback: "df"
+        return _DF_REPLY_KINDS.get(type(payload), "df"), payload
 
     # ------------------------------------------------------------------ #
     # Messages from other agents
     # ------------------------------------------------------------------ #
-    lang = str(acl.get("language", "")).lower()
-
-    if lang == "fipa-sl0":
-        try:
-            payload = content_utils.decode_content(acl)
+    if acl.language_lower == "fipa-sl0":
+        ok, payload = content_utils.try_decode_content(acl)
+        if ok:
             return "ext-sl0", payload
-        except Exception as exc:  # invalid payload
-            return "ext-raw", f"(SL0 inválido) {exc}: {acl.get('content', '')}"
-    else:
-        return "ext-raw", acl.get("content", "<sem content>")
+        # invalid payload
+        return "ext-raw", f"(SL0 inválido) {payload}: {acl.get('content', '')}"
+    return "ext-raw", acl.get("content", "<sem content>")
+
+
+# --------------------------------------------------------------------------- #
+# classify_message_async
+# --------------------------------------------------------------------------- #
+async def classify_message_async(
+    env: Envelope,
+    acl: AclMessage,
+    df_aid: AgentIdentifier | None,
+    *,
+    executor: Optional[Executor] = None,
+) -> Tuple[Kind, Any]:
+    """Async wrapper around :func:`classify_message`.
+
+    Messages whose content reaches :data:`content.OFFLOAD_MIN_SIZE` characters
+    are classified in *executor* so SL decoding does not block the event
+    loop; smaller ones are classified inline.
+    """
+    txt = acl.content
+    if not isinstance(txt, str) or len(txt) < content_utils.OFFLOAD_MIN_SIZE:
+        return classify_message(env, acl, df_aid)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, classify_message, env, acl, df_aid)
@@ -10,7 +10,9 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import (
     Any,
     AsyncIterator,
@@ -20,20 +22,32 @@ from typing import (
     Tuple,
     Union,
 )
+from urllib.parse import urlparse
 
 import aiohttp.web
 
+from ..message import serialize
 from ..message.acl import AclMessage
 from ..message.aid import AgentIdentifier
-from ..message.envelope import Envelope
 from ..sl import sl0
 from ..transport.http_client import HttpMtpClient
-from ..transport.http_mtp import HttpMtpServer, start_server
+from ..transport.http_mtp import (
+    MAX_INBOX,
+    HttpMtpServer,
+    SharedMtpHost,
+    start_server,
+)
+from ..util.compat import DATACLASS_SLOTS
 from . import df_manager, event, router
 from .conversation import ConversationManager
 from .dispatcher import Callback, InboundDispatcher
 from .message_template import MessageTemplate
 
+_log = logging.getLogger("peak_acl.runtime")
+
+# Default capacity of the event queue consumed by ``async for evt in ep``.
+MAX_EVENTS = 4096
+
 
 # --------------------------------------------------------------------------- #
 def _first_url(ai: AgentIdentifier) -> str:
@@ -42,15 +56,14 @@ def _first_url(ai: AgentIdentifier) -> str:
     return ai.addresses[0]
 
 
-# --------------------------------------------------------------------------- #
-@dataclass
-class _RawMsg:  # só para a fila interna
-    env: Envelope
-    acl: AclMessage
+@lru_cache(maxsize=256)
+def _port_of(addr: str) -> int:
+    """TCP port of an HTTP address (80 when the URL does not set one)."""
+    return urlparse(addr).port or 80
 
 
 # --------------------------------------------------------------------------- #
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CommEndpoint(AsyncIterator[event.MsgEvent]):
     """Bundle of HTTP-MTP transport, dispatcher and DF helpers.
 
@@ -67,6 +80,19 @@ class CommEndpoint(AsyncIterator[event.MsgEvent]):
         ``aiohttp`` objects controlling the inbound HTTP server.
     df_aid :
         Optional Directory Facilitator identifier for DF helpers.
+    shared_host :
+        :class:`SharedMtpHost` this endpoint is attached to, if any. Closing
+        the endpoint then detaches it instead of stopping the server.
+
+    Notes
+    -----
+    * Declared with ``__slots__`` (Python ≥ 3.10): attributes outside the
+      fields below cannot be added to an instance.
+    * Unhandled messages are queued as events for ``async for``; the queue
+      holds :data:`MAX_EVENTS` entries by default. Iterating is optional, so
+      when it is full the oldest event is dropped rather than stalling
+      callbacks and conversations (logged at INFO the first time, then at
+      DEBUG).
 
     Examples
     --------
@@ -80,7 +106,7 @@ class CommEndpoint(AsyncIterator[event.MsgEvent]):
     client: HttpMtpClient
     server: HttpMtpServer
     runner: aiohttp.web.AppRunner
-    site: aiohttp.web.TCPSite
+    site: aiohttp.web.BaseSite
     df_aid: Optional[AgentIdentifier] = field(default=None)
 
     # ponto 5
@@ -89,9 +115,10 @@ class CommEndpoint(AsyncIterator[event.MsgEvent]):
 
     # fila de eventos para quem iterar sobre o endpoint
     _events: asyncio.Queue[event.MsgEvent] = field(
-        default_factory=lambda: asyncio.Queue(maxsize=0)
+        default_factory=lambda: asyncio.Queue(maxsize=MAX_EVENTS)
     )
     _bg_task: Optional[asyncio.Task] = None
+    shared_host: Optional[SharedMtpHost] = None
 
     # ---------------------------- DF helpers ------------------------------ #
     async def register_df(
@@ -186,6 +213,13 @@ class CommEndpoint(AsyncIterator[event.MsgEvent]):
         AclMessage
             The message instance that was dispatched.
 
+        Notes
+        -----
+        * ``to`` is copied into ``msg.receivers``; later changes to the
+          caller's list do not affect the message.
+        * Receivers are sent to concurrently; the first failure is raised
+          once every send has been started (others are not cancelled).
+
         Examples
         --------
         >>> await ep.send_acl(to=aid, performative="inform", content="hi")
@@ -195,6 +229,11 @@ class CommEndpoint(AsyncIterator[event.MsgEvent]):
         if not receivers:
             raise ValueError("send_acl() sem receivers.")
 
+        # Resolve every destination once, up front: a receiver without an
+        # address fails before anything is sent, and the send loop no longer
+        # walks ``addresses`` per recipient.
+        urls = [_first_url(r) for r in receivers]
+
         content_str = (
             None
             if content is None
@@ -215,8 +254,19 @@ class CommEndpoint(AsyncIterator[event.MsgEvent]):
             reply_by=reply_by,
         )
 
-        for r in receivers:
-            await self.client.send(r, self.my_aid, msg, _first_url(r))
+        # Only the envelope differs per receiver: serialize the ACL text once,
+        # then post to every receiver concurrently.
+        acl_text = serialize.dumps(msg)
+        send = self.client.send
+        if len(receivers) == 1:  # unicast: no gather/Task wrapping
+            await send(receivers[0], self.my_aid, msg, urls[0], acl_text=acl_text)
+            return msg
+        await asyncio.gather(
+            *[
+                send(r, self.my_aid, msg, url, acl_text=acl_text)
+                for r, url in zip(receivers, urls)
+            ]
+        )
         return msg
 
     # ---------------------- açucar ConversationMgr ----------------------- #
@@ -266,23 +316,45 @@ class CommEndpoint(AsyncIterator[event.MsgEvent]):
     # ---------------------- background loop ----------------------------- #
     async def _pump(self):
         """Corre em background: esvazia inbox e trata callbacks."""
+        # Fixed for the endpoint's lifetime -> bound once. ``df_aid`` and
+        # ``conv_mgr`` are public and may be replaced, so they are re-read.
+        inbox_get = self.inbox.get
+        dispatch = self.dispatcher.dispatch
+        classify = router.classify_message_async
+        events = self._events
+        msg_event = event.MsgEvent
+        overflowed = False
         while True:
-            env, acl = await self.inbox.get()
+            env, acl = await inbox_get()
+            sender = env.from_
 
             # 1) callbacks registados
-            handled = await self.dispatcher.dispatch(env.from_, acl)
-            if handled:
+            if await dispatch(sender, acl):
                 continue
 
             # 2) classificação
-            kind, payload = router.classify_message(env, acl, self.df_aid)
+            kind, payload = await classify(env, acl, self.df_aid)
 
             # 3) conversas
-            if self.conv_mgr:
-                self.conv_mgr.on_message(acl)
-
-            # 4) expõe ao iterador
-            await self._events.put(event.MsgEvent(env, acl, env.from_, kind, payload))
+            conv_mgr = self.conv_mgr
+            if conv_mgr:
+                conv_mgr.on_message(acl)
+
+            # 4) expõe ao iterador; nunca suspende (o iterador é opcional)
+            evt = msg_event(env, acl, sender, kind, payload)
+            try:
+                events.put_nowait(evt)
+            except asyncio.QueueFull:
+                dropped = events.get_nowait()
+                events.put_nowait(evt)
+                # Normal for endpoints that never iterate: say so once only
+                _log.log(
+                    logging.DEBUG if overflowed else logging.INFO,
+                    "Fila de eventos cheia (%d); evento mais antigo descartado: %s",
+                    events.maxsize,
+                    dropped.kind,
+                )
+                overflowed = True
 
     # ---------------------- fecho --------------------------------------- #
     async def close(self):
@@ -290,7 +362,10 @@ class CommEndpoint(AsyncIterator[event.MsgEvent]):
             self._bg_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._bg_task
-        await self.runner.cleanup()
+        if self.shared_host is not None:
+            self.shared_host.detach(self.my_aid.name)
+        else:
+            await self.runner.cleanup()
         await self.client.close()
 
 
@@ -303,6 +378,9 @@ async def start_endpoint(
     df_aid: Optional[AgentIdentifier] = None,
     services: Optional[Sequence[Tuple[str, str]]] = None,
     http_client: Optional[HttpMtpClient] = None,
+    max_inbox: int = MAX_INBOX,
+    max_events: int = MAX_EVENTS,
+    shared_host: Optional[SharedMtpHost] = None,
     loop=None,
 ) -> CommEndpoint:
     """Create and start an HTTP-MTP endpoint for an agent.
@@ -323,6 +401,17 @@ async def start_endpoint(
     http_client :
         Existing :class:`HttpMtpClient` to reuse. A new one is created if
         omitted.
+    max_inbox :
+        Capacity of the inbound queue; when full, the HTTP server delays its
+        replies until the endpoint catches up (``0`` means unbounded).
+        Ignored with *shared_host*, which sizes its own inboxes.
+    max_events :
+        Capacity of the event queue read by ``async for evt in ep``; when
+        full, the oldest event is dropped (``0`` means unbounded).
+    shared_host :
+        Attach to this :class:`SharedMtpHost` (started on first use) instead
+        of starting a dedicated HTTP server; *bind_host* and the port of
+        ``my_aid`` are then not used.
     loop :
         Event loop to use (primarily for testing).
 
@@ -336,23 +425,31 @@ async def start_endpoint(
     >>> my = AgentIdentifier("me", ["http://127.0.0.1:8000/acc"])
     >>> ep = await start_endpoint(my_aid=my)
     """
-    from urllib.parse import urlparse
-
-    port = urlparse(my_aid.addresses[0]).port or 80
+    if shared_host is not None:
+        await shared_host.start()
+        inbox = shared_host.attach(my_aid.name)
+        server, runner, site = shared_host.server, shared_host.runner, shared_host.site
+    else:
+        server, runner, site = await start_server(
+            on_message=None,
+            bind_host=bind_host,
+            port=_port_of(my_aid.addresses[0]),
+            loop=loop,
+            max_inbox=max_inbox,
+        )
+        inbox = server.inbox
     client = http_client or HttpMtpClient()
 
-    server, runner, site = await start_server(
-        on_message=None, bind_host=bind_host, port=port, loop=loop
-    )
-
     ep = CommEndpoint(
         my_aid=my_aid,
-        inbox=server.inbox,
+        inbox=inbox,
         client=client,
         server=server,
         runner=runner,
         site=site,
         df_aid=df_aid,
+        _events=asyncio.Queue(maxsize=max_events),
+        shared_host=shared_host,
     )
 
     # ConversationManager (ponto 4)
@@ -39,10 +39,21 @@ Parsing is intentionally lenient: unknown slots are ignored.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
-from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from ..message.aid import AgentIdentifier
+from ..util.compat import DATACLASS_SLOTS
 
 __all__ = [
     "ServiceDescription",
@@ -57,6 +68,8 @@ __all__ = [
     "Result",
     "dumps",
     "loads",
+    "try_loads",
+    "parse_sexpr",
     "build_ast",
     "is_done",
     "is_failure",
@@ -68,7 +81,7 @@ __all__ = [
 # ------------------------------------------------------------------ #
 # AST dataclasses
 # ------------------------------------------------------------------ #
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ServiceDescription:
     """SL0 ``service-description`` node."""
 
@@ -81,7 +94,7 @@ class ServiceDescription:
     properties: List[Tuple[str, str]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DfAgentDescription:
     """SL0 ``df-agent-description`` node."""
 
@@ -93,44 +106,44 @@ class DfAgentDescription:
     ownership: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Register:
     dfad: DfAgentDescription
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Deregister:
     dfad: DfAgentDescription
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Modify:
     dfad: DfAgentDescription
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Search:
     template: DfAgentDescription
     max_results: Optional[int] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Action:
     actor: AgentIdentifier
     act: Union[Register, Deregister, Modify, Search]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Done:
     what: Any
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Failure:
     reason: Any
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Result:
     what: Any
     value: Any
@@ -258,123 +271,172 @@ def _render_dfad(dfad: DfAgentDescription) -> str:
 # ------------------------------------------------------------------ #
 def loads(src: str) -> Any:
     """Parse an SL0 string into the corresponding AST objects."""
-    toks = list(_tokenize(src))
+    return _build_ast(parse_sexpr(src))
+
+
+def parse_sexpr(src: str) -> Any:
+    """Parse an SL0 string into nested lists, the input of :func:`build_ast`.
+
+    :func:`build_ast` never hands these lists out, so one parse can be kept
+    and built into fresh objects any number of times.
+    """
+    toks = _tokenize(src)
     expr, pos = _parse_expr(toks, 0)
     if pos != len(toks):
         raise ValueError("Tokens sobrando no fim do SL0.")
-    return _build_ast(expr)
+    return expr
 
 
-# --- tokenizer ------------------------------------------------------------- #
-def _tokenize(s: str) -> Iterator[str]:
-    """Yield tokens from an SL0 string (very simple lexer)."""
-    i, n = 0, len(s)
-    while i < n:
-        c = s[i]
-        if c.isspace():
-            i += 1
-            continue
-        if c in "()":
-            yield c
-            i += 1
-            continue
-        if c == '"':
-            i += 1
-            buf = []
-            while i < n:
-                c = s[i]
-                if c == "\\" and i + 1 < n:
-                    buf.append(s[i + 1])
-                    i += 2
-                    continue
-                if c == '"':
-                    i += 1
-                    break
-                buf.append(c)
-                i += 1
-            yield '"' + "".join(buf) + '"'
-            continue
-        j = i
-        while j < n and not s[j].isspace() and s[j] not in "()":
-            j += 1
-        yield s[i:j]
-        i = j
+def try_loads(src: str) -> Any:
+    """Like :func:`loads`, but return ``None`` instead of raising on bad input."""
+    try:
+        return loads(src)
+    except ValueError:
+        return None
 
 
-# --- recursive descent to nested Python lists ------------------------------ #
+# --- tokenizer ------------------------------------------------------------- #
+# One alternation scanned in C: "(" / ")", a double-quoted string (backslash
+# escapes the next char; an unterminated string runs to the end of input), or
+# a bare atom.
+_TOKEN_RE = re.compile(
+    r'\s*(?:([()])|"((?:[^"\\]|\\.?)*)(?:"|\Z)|([^\s()]+))', re.DOTALL
+)
+_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+
+
+def _tokenize(s: str) -> List[str]:
+    """Return the tokens of an SL0 string (regex-driven lexer)."""
+    toks: List[str] = []
+    append = toks.append
+    for paren, body, atom in _TOKEN_RE.findall(s):
+        if paren:
+            append(paren)
+        elif atom:
+            append(atom)
+        else:  # quoted string (possibly empty)
+            if "\\" in body:
+                body = _ESCAPE_RE.sub(r"\1", body)
+            append('"' + body + '"')
+    return toks
+
+
+# --- S-expression parser to nested Python lists ---------------------------- #
 def _parse_expr(toks: List[str], pos: int):
-    """Recursive-descent parse to nested Python lists (S-expression style)."""
-    if pos >= len(toks):
+    """Parse one S-expression starting at *pos* into nested Python lists.
+
+    Iterative: open lists live on an explicit stack, so nesting depth is not
+    bounded by the interpreter's recursion limit.
+    """
+    n = len(toks)
+    if pos >= n:
         raise ValueError("Fim inesperado.")
-    t = toks[pos]
-    if t == "(":
-        lst: List[Any] = []
-        pos += 1
-        while pos < len(toks) and toks[pos] != ")":
-            sub, pos = _parse_expr(toks, pos)
-            lst.append(sub)
-        if pos >= len(toks):
-            raise ValueError("Parêntese não fechado.")
+    stack: List[List[Any]] = []
+    while pos < n:
+        t = toks[pos]
         pos += 1
-        return lst, pos
-    if t == ")":
-        raise ValueError("')' inesperado.")
-    if t.startswith('"') and t.endswith('"') and len(t) >= 2:
-        return t[1:-1], pos + 1
-    return t, pos + 1
+        if t == "(":
+            stack.append([])
+            continue
+        if t == ")":
+            if not stack:
+                raise ValueError("')' inesperado.")
+            node: Any = stack.pop()
+        elif t.startswith('"') and t.endswith('"') and len(t) >= 2:
+            node = t[1:-1]
+        else:
+            node = t
+        if not stack:
+            return node, pos
+        stack[-1].append(node)
+    raise ValueError("Parêntese não fechado.")
 
 
 # --- AST builder ----------------------------------------------------------- #
-def _build_ast(e: Any) -> Any:
-    """Transform the nested Python list into our SL0 dataclasses."""
-    if not isinstance(e, list) or not e:
-        return e
-    head = str(e[0]).lower()
-
-    if head == "action" and len(e) >= 3:
-        actor = _build_aid(e[1])
-        act = _build_ast(e[2])
-        return Action(actor=actor, act=act)
-
-    if head == "register" and len(e) >= 2:
-        return Register(_build_dfad(e[1]))
-
-    if head == "deregister" and len(e) >= 2:
-        return Deregister(_build_dfad(e[1]))
-
-    if head == "modify" and len(e) >= 2:
-        return Modify(_build_dfad(e[1]))
+# Builder signature: (form, built terms at the form's term indices) -> node.
+_Builder = Callable[[List[Any], List[Any]], Any]
 
-    if head == "search" and len(e) >= 2:
-        templ = _build_dfad(e[1])
-        maxres = None
-        if len(e) >= 3:
-            try:
-                maxres = int(e[2])
-            except Exception:
-                pass
-        return Search(template=templ, max_results=maxres)
 
-    if head == "done" and len(e) >= 2:
-        return Done(_build_ast(e[1]))
-
-    if head == "failure" and len(e) >= 2:
-        return Failure(_build_ast(e[1]))
-
-    if head == "result" and len(e) >= 3:
-        return Result(_build_ast(e[1]), _build_ast(e[2]))
-
-    if head == "df-agent-description":
-        return _build_dfad(e)
-
-    if head == "service-description":
-        return _build_sd(e)
-
-    if head == "agent-identifier":
-        return _build_aid(e)
+def _build_ast(e: Any) -> Any:
+    """Transform the nested Python list into our SL0 dataclasses.
 
-    # Generic fallback
-    return [_build_ast(x) for x in e]
+    Iterative, like :func:`_parse_expr`: the forms that nest arbitrary SL terms
+    (plain lists, ``done``, ``failure``, ``result``, ``action``) are built
+    bottom-up from an explicit stack. The typed builders (``df-agent-description``
+    and friends) only look a fixed number of levels down and are called directly.
+    """
+    if not isinstance(e, list):
+        return e
+    if not e:
+        return []  # fresh: *e* may be reused (see parse_sexpr)
+    indices, builder = _plan(e)
+    # Frames: (form, indices of nested terms, builder, terms built so far)
+    stack: List[Tuple[List[Any], Sequence[int], _Builder, List[Any]]] = [
+        (e, indices, builder, [])
+    ]
+    while True:
+        form, indices, builder, built = stack[-1]
+        if len(built) < len(indices):
+            child = form[indices[len(built)]]
+            if isinstance(child, list):
+                if child:
+                    idx, b = _plan(child)
+                    stack.append((child, idx, b, []))
+                    continue
+                child = []
+            built.append(child)
+            continue
+        value = builder(form, built)
+        stack.pop()
+        if not stack:
+            return value
+        stack[-1][3].append(value)
+
+
+def _plan(e: List[Any]) -> Tuple[Sequence[int], _Builder]:
+    """Return the nested-term indices and the builder for the non-empty list *e*."""
+    head = e[0]
+    if isinstance(head, str):
+        # Heads are nearly always lowercase already: try them as-is first.
+        entry = _HEAD_BUILDERS.get(head)
+        if entry is None:
+            entry = _HEAD_BUILDERS.get(head.lower())
+        if entry is not None and len(e) >= entry[0]:
+            return entry[1], entry[2]
+    # Generic fallback: every item is a term, the result a plain list
+    return range(len(e)), _as_list
+
+
+def _as_list(_e: List[Any], terms: List[Any]) -> List[Any]:
+    return terms
+
+
+def _build_search(e: List[Any], _terms: List[Any]) -> Search:
+    templ = _build_dfad(e[1])
+    maxres = None
+    if len(e) >= 3:
+        try:
+            maxres = int(e[2])
+        except Exception:
+            pass
+    return Search(template=templ, max_results=maxres)
+
+
+# head -> (minimum list length, indices of nested SL terms, builder); shorter
+# forms fall back to lists.
+_HEAD_BUILDERS: Dict[str, Tuple[int, Tuple[int, ...], _Builder]] = {
+    "action": (3, (2,), lambda e, t: Action(actor=_build_aid(e[1]), act=t[0])),
+    "register": (2, (), lambda e, _: Register(_build_dfad(e[1]))),
+    "deregister": (2, (), lambda e, _: Deregister(_build_dfad(e[1]))),
+    "modify": (2, (), lambda e, _: Modify(_build_dfad(e[1]))),
+    "search": (2, (), _build_search),
+    "done": (2, (1,), lambda _, t: Done(t[0])),
+    "failure": (2, (1,), lambda _, t: Failure(t[0])),
+    "result": (3, (1, 2), lambda _, t: Result(t[0], t[1])),
+    "df-agent-description": (1, (), lambda e, _: _build_dfad(e)),
+    "service-description": (1, (), lambda e, _: _build_sd(e)),
+    "agent-identifier": (1, (), lambda e, _: _build_aid(e)),
+}
 
 
 def build_ast(e: Any) -> Any:
@@ -386,155 +448,111 @@ def _build_aid(e: Any) -> AgentIdentifier:
     """Build an :class:`AgentIdentifier` from a parsed list."""
     if not isinstance(e, list):
         return AgentIdentifier(str(e), [])
-    name = None
-    addrs: List[str] = []
-    i = 1
-    while i < len(e):
-        tag = e[i]
-        if isinstance(tag, str):
-            lt = tag.lower()
-            if lt == ":name" and i + 1 < len(e):
-                name = str(e[i + 1])
-                i += 2
-                continue
-            if lt == ":addresses" and i + 1 < len(e):
-                addrs = _extract_sequence(e[i + 1])
-                i += 2
-                continue
-        i += 1
-    if name is None:
+    slots = _read_slots(e, _AID_SLOTS)
+    if "name" not in slots:
         raise ValueError("agent-identifier sem :name")
-    return AgentIdentifier(name, addrs)
+    return AgentIdentifier(slots["name"], slots.get("addresses", []))
 
 
 def _build_sd(e: Any) -> ServiceDescription:
     """Build a :class:`ServiceDescription` from a parsed list."""
-    sd = ServiceDescription()
-    i = 1
-    while i < len(e):
-        tag = e[i]
-        if isinstance(tag, str):
-            lt = tag.lower()
-            if lt == ":name" and i + 1 < len(e):
-                sd.name = str(e[i + 1])
-                i += 2
-                continue
-            if lt == ":type" and i + 1 < len(e):
-                sd.type = str(e[i + 1])
-                i += 2
-                continue
-            if lt == ":languages" and i + 1 < len(e):
-                sd.languages = _extract_set(e[i + 1])
-                i += 2
-                continue
-            if lt == ":ontologies" and i + 1 < len(e):
-                sd.ontologies = _extract_set(e[i + 1])
-                i += 2
-                continue
-            if lt == ":protocols" and i + 1 < len(e):
-                sd.protocols = _extract_set(e[i + 1])
-                i += 2
-                continue
-            if lt == ":properties" and i + 1 < len(e):
-                sd.properties = _extract_properties(e[i + 1])
-                i += 2
-                continue
-        i += 1
-    return sd
+    return ServiceDescription(**_read_slots(e, _SD_SLOTS))
 
 
 def _build_dfad(e: Any) -> DfAgentDescription:
     """Build a :class:`DfAgentDescription` from a parsed list."""
     if not isinstance(e, list):
         raise ValueError("df-agent-description malformado")
-    dfad = DfAgentDescription()
-    i = 1  # skip head
-    while i < len(e):
+    return DfAgentDescription(**_read_slots(e, _DFAD_SLOTS))
+
+
+# Slot tag -> (field name, converter)
+_SlotTable = Dict[str, Tuple[str, Callable[[Any], Any]]]
+
+
+def _read_slots(e: Any, table: _SlotTable) -> Dict[str, Any]:
+    """Collect the ``:slot value`` pairs of *e* (head skipped) known to *table*.
+
+    *table* maps a lowercased slot tag to ``(field name, converter)``; unknown
+    tags and a trailing tag without value are skipped, later slots win.
+    """
+    out: Dict[str, Any] = {}
+    i = 1
+    n = len(e)
+    while i < n:
         tag = e[i]
-        if isinstance(tag, str):
-            lt = tag.lower()
-            if lt == ":name" and i + 1 < len(e):
-                dfad.name = _build_aid(e[i + 1])
-                i += 2
-                continue
-            if lt == ":services" and i + 1 < len(e):
-                dfad.services = _extract_services(e[i + 1])
-                i += 2
-                continue
-            if lt == ":languages" and i + 1 < len(e):
-                dfad.languages = _extract_set(e[i + 1])
-                i += 2
-                continue
-            if lt == ":ontologies" and i + 1 < len(e):
-                dfad.ontologies = _extract_set(e[i + 1])
-                i += 2
-                continue
-            if lt == ":protocols" and i + 1 < len(e):
-                dfad.protocols = _extract_set(e[i + 1])
-                i += 2
-                continue
-            if lt == ":ownership" and i + 1 < len(e):
-                dfad.ownership = _extract_set(e[i + 1])
+        if isinstance(tag, str) and i + 1 < n:
+            spec = table.get(tag)
+            if spec is None:
+                spec = table.get(tag.lower())
+            if spec is not None:
+                out[spec[0]] = spec[1](e[i + 1])
                 i += 2
                 continue
         i += 1
-    return dfad
+    return out
 
 
 # --- extractors ------------------------------------------------------------ #
+def _members(e: Any, head: str) -> List[Any]:
+    """Return the items of ``(head x y ...)``, of a bare list, or ``[e]``.
+
+    *head* must already be lowercase.
+    """
+    if not isinstance(e, list):
+        return [e]
+    if e and isinstance(e[0], str) and (e[0] == head or e[0].lower() == head):
+        return e[1:]
+    return e
+
+
 def _extract_sequence(e: Any) -> List[str]:
     """Extract a sequence list from an AST node."""
-    if (
-        isinstance(e, list)
-        and e
-        and isinstance(e[0], str)
-        and e[0].lower() == "sequence"
-    ):
-        return [str(x) for x in e[1:]]
-    if isinstance(e, list):
-        return [str(x) for x in e]
-    return [str(e)]
+    return [str(x) for x in _members(e, "sequence")]
 
 
 def _extract_set(e: Any) -> List[str]:
     """Extract a set list from an AST node."""
-    if isinstance(e, list) and e and isinstance(e[0], str) and e[0].lower() == "set":
-        return [str(x) for x in e[1:]]
-    if isinstance(e, list):
-        return [str(x) for x in e]
-    return [str(e)]
+    return [str(x) for x in _members(e, "set")]
 
 
 def _extract_properties(e: Any) -> List[Tuple[str, str]]:
     """Extract DF properties ``[(name, value)]`` from an AST node."""
     out: List[Tuple[str, str]] = []
-    items = e[1:] if isinstance(e, list) and e and str(e[0]).lower() == "set" else e
-    if not isinstance(items, list):
-        items = [items]
-    for it in items:
+    for it in _members(e, "set"):
         if isinstance(it, list) and it and str(it[0]).lower() == "property":
-            name = value = ""
-            j = 1
-            while j < len(it):
-                tag = it[j]
-                if isinstance(tag, str):
-                    lt = tag.lower()
-                    if lt == ":name" and j + 1 < len(it):
-                        name = str(it[j + 1])
-                        j += 2
-                        continue
-                    if lt == ":value" and j + 1 < len(it):
-                        value = str(it[j + 1])
-                        j += 2
-                        continue
-                j += 1
-            out.append((name, value))
+            slots = _read_slots(it, _PROPERTY_SLOTS)
+            out.append((slots.get("name", ""), slots.get("value", "")))
     return out
 
 
 def _extract_services(e: Any) -> List[ServiceDescription]:
     """Extract a list of :class:`ServiceDescription` from an AST node."""
-    items = e[1:] if isinstance(e, list) and e and str(e[0]).lower() == "set" else e
-    if not isinstance(items, list):
-        items = [items]
-    return [_build_sd(x) for x in items]
+    return [_build_sd(x) for x in _members(e, "set")]
+
+
+# Slot tables for :func:`_read_slots`.
+_AID_SLOTS: _SlotTable = {
+    ":name": ("name", str),
+    ":addresses": ("addresses", _extract_sequence),
+}
+_SD_SLOTS: _SlotTable = {
+    ":name": ("name", str),
+    ":type": ("type", str),
+    ":languages": ("languages", _extract_set),
+    ":ontologies": ("ontologies", _extract_set),
+    ":protocols": ("protocols", _extract_set),
+    ":properties": ("properties", _extract_properties),
+}
+_DFAD_SLOTS: _SlotTable = {
+    ":name": ("name", _build_aid),
+    ":services": ("services", _extract_services),
+    ":languages": ("languages", _extract_set),
+    ":ontologies": ("ontologies", _extract_set),
+    ":protocols": ("protocols", _extract_set),
+    ":ownership": ("ownership", _extract_set),
+}
+_PROPERTY_SLOTS: _SlotTable = {
+    ":name": ("name", str),
+    ":value": ("value", str),
+}
@@ -0,0 +1,183 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Santiago Bossa
+#
+# This file is part of peak-acl.
+#
+# peak-acl is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# peak-acl is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with peak-acl.  If not, see the LICENSE file in the project root.
+
+# peak_acl/sl/sl_parser_fast.py
+"""
+Hand-written FIPA-SL parser producing the :mod:`sl_visitor` AST directly.
+
+Covers the fragment :class:`~peak_acl.sl.sl_visitor.ASTBuilder` understands::
+
+    msg    : '(' performative slot* ')'
+    slot   : ':'NAME term
+    term   : string | number | variable | '(' 'action' term term ')'
+           | '(' NAME term* ')'
+
+One regex pass tokenizes the text and a descent parser (iterative below the
+slot level) builds :class:`SLSentence` / :class:`SLFunc` / ... nodes as it
+goes, so neither an ANTLR parse tree nor a visitor pass is involved.
+
+Public API
+----------
+- :func:`parse_fast`     → :class:`SLSentence`; raises ``ValueError``
+- :func:`try_parse_fast` → same, but returns ``None`` on invalid input
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, List, Optional, Tuple
+
+from .sl_visitor import SLAction, SLFunc, SLNumber, SLSentence, SLString, SLVar
+
+__all__ = ["parse_fast", "try_parse_fast"]
+
+# "(" / ")", a double-quoted string (body captured without the quotes;
+# backslash escapes the next char), a bare word, or any other char (error).
+_TOKEN_RE = re.compile(r'\s*(?:([()])|"((?:[^"\\]|\\.)*)"|([^\s()"]+)|(\S))', re.DOTALL)
+_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?")
+_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)  # same unescaping as sl0
+
+_Token = Tuple[str, str]  # (kind, text); kind in "(", ")", "str", "word"
+
+
+# --------------------------------------------------------------------------- #
+# Public API
+# --------------------------------------------------------------------------- #
+def parse_fast(text: str) -> SLSentence:
+    """Parse ``( performative :slot term ... )`` into an :class:`SLSentence`.
+
+    Raises
+    ------
+    ValueError
+        If *text* is not a well-formed SL message of the supported fragment.
+    """
+    toks = _tokenize(text)
+    sentence, pos = _parse_msg(toks, 0)
+    if pos != len(toks):
+        raise ValueError("Tokens sobrando no fim do SL.")
+    return sentence
+
+
+def try_parse_fast(text: str) -> Optional[SLSentence]:
+    """Like :func:`parse_fast`, but return ``None`` instead of raising."""
+    try:
+        return parse_fast(text)
+    except ValueError:
+        return None
+
+
+# --------------------------------------------------------------------------- #
+# Tokenizer
+# --------------------------------------------------------------------------- #
+def _tokenize(text: str) -> List[_Token]:
+    """Split *text* into ``(kind, text)`` tokens."""
+    toks: List[_Token] = []
+    for paren, body, word, bad in _TOKEN_RE.findall(text):
+        if paren:
+            toks.append((paren, paren))
+        elif word:
+            toks.append(("word", word))
+        elif bad:
+            raise ValueError(f"Carácter inesperado no SL: {bad!r}")
+        else:  # quoted string (possibly empty)
+            if "\\" in body:
+                body = _ESCAPE_RE.sub(r"\1", body)
+            toks.append(("str", body))
+    return toks
+
+
+# --------------------------------------------------------------------------- #
+# Recursive descent
+# --------------------------------------------------------------------------- #
+def _expect(toks: List[_Token], pos: int, kind: str) -> int:
+    if pos >= len(toks) or toks[pos][0] != kind:
+        raise ValueError(f"Esperado '{kind}' na posição {pos} do SL.")
+    return pos + 1
+
+
+def _parse_name(toks: List[_Token], pos: int) -> str:
+    if pos >= len(toks) or toks[pos][0] != "word":
+        raise ValueError(f"Esperado nome na posição {pos} do SL.")
+    return toks[pos][1]
+
+
+def _parse_msg(toks: List[_Token], pos: int) -> Tuple[SLSentence, int]:
+    pos = _expect(toks, pos, "(")
+    performative = _parse_name(toks, pos)
+    pos += 1
+    slots: List[Any] = []
+    n = len(toks)
+    while pos < n and toks[pos][0] == "word":
+        key = toks[pos][1]
+        if not key.startswith(":") or len(key) == 1:
+            raise ValueError(f"Slot inválido no SL: {key!r}")
+        term, pos = _parse_term(toks, pos + 1)
+        slots.append((key[1:], term))
+    pos = _expect(toks, pos, ")")
+    return SLSentence(performative, tuple(slots)), pos
+
+
+def _parse_term(toks: List[_Token], pos: int) -> Tuple[Any, int]:
+    """Parse one term starting at *pos*.
+
+    Iterative: open ``(NAME ...)`` forms live on an explicit stack, so nesting
+    depth is not bounded by the interpreter's recursion limit.
+    """
+    n = len(toks)
+    stack: List[Tuple[str, List[Any]]] = []  # (name, args) of open forms
+    while True:
+        if stack:
+            name, args = stack[-1]
+            node: Any = None
+            if name == "action":
+                # '(' 'action' term term ')'
+                if len(args) == 2:
+                    pos = _expect(toks, pos, ")")
+                    node = SLAction(args[0], args[1])
+            elif pos < n and toks[pos][0] == ")":
+                pos += 1
+                node = SLFunc(name, tuple(args))
+            if node is not None:
+                stack.pop()
+                if not stack:
+                    return node, pos
+                stack[-1][1].append(node)
+                continue
+
+        if pos >= n:
+            raise ValueError("Fim inesperado do SL.")
+        kind, text = toks[pos]
+        if kind == "(":
+            stack.append((_parse_name(toks, pos + 1), []))
+            pos += 2
+            continue
+        if kind == "str":
+            node = SLString(text)
+        elif kind == "word":
+            if text.startswith("?") and len(text) > 1:
+                node = SLVar(text)
+            elif _NUMBER_RE.fullmatch(text):
+                node = SLNumber(float(text))
+            else:
+                raise ValueError(f"Termo inválido no SL: {text!r}")
+        else:
+            raise ValueError("')' inesperado no SL.")
+        pos += 1
+        if not stack:
+            return node, pos
+        stack[-1][1].append(node)
@@ -30,48 +30,51 @@ Public API
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, List
+from dataclasses import dataclass
+from typing import Any, Tuple
 
 from antlr4.tree.Tree import ParseTree
 
 from ..generated.FipaSLParser import FipaSLParser
 from ..generated.FipaSLVisitor import FipaSLVisitor
+from ..util.compat import DATACLASS_SLOTS
 
 
 # --------------------------------------------------------------------------- #
 # AST nodes (could be moved to sl_ast.py in the future)
 # --------------------------------------------------------------------------- #
-@dataclass
+# Slotted where supported: decoded payloads are cached and can be large, so
+# nodes carry no per-instance ``__dict__``.
+@dataclass(**DATACLASS_SLOTS)
 class SLString:
     """String literal node (quotes removed)."""
 
     text: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SLNumber:
     """Numeric literal node (stored as float)."""
 
     value: float
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SLVar:
     """Variable node (e.g., ``?x``)."""
 
     name: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SLFunc:
     """Function application node: ``(name arg1 arg2 ...)``."""
 
     name: str
-    args: List[Any] = field(default_factory=list)  # Any → other AST nodes
+    args: Tuple[Any, ...] = ()  # Any → other AST nodes
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SLAction:
     """``(action actor inner)`` construct."""
 
@@ -79,12 +82,12 @@ class SLAction:
     inner: Any  # inner term/function of the action
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SLSentence:
     """Top-level SL sentence: typically ``(inform ...)`` / ``(request ...)``."""
 
     performative: str
-    slots: List[Any] = field(default_factory=list)
+    slots: Tuple[Any, ...] = ()  # (name, term) pairs
 
 
 # --------------------------------------------------------------------------- #
@@ -108,7 +111,7 @@ class ASTBuilder(FipaSLVisitor):
     def visitMsg(self, ctx: FipaSLParser.MsgContext):
         # ( performative slot* )
         perform = ctx.performative().getText()
-        slots = [self.visit(s) for s in ctx.slot()]
+        slots = tuple([self.visit(s) for s in ctx.slot()])
         return SLSentence(perform, slots)
 
     # --- slots ------------------------------------------------------ #
@@ -147,7 +150,7 @@ class ASTBuilder(FipaSLVisitor):
     # --- function --------------------------------------------------- #
     def visitFunctionExpr(self, ctx: FipaSLParser.FunctionExprContext):
         name = ctx.NAME().getText()
-        args = [self.visit(t) for t in ctx.term()]
+        args = tuple([self.visit(t) for t in ctx.term()])
         return SLFunc(name, args)
 
     # --- action ----------------------------------------------------- #
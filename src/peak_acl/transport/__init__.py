@@ -6,13 +6,14 @@ exchange.
 """
 
 from .http_client import HttpMtpClient, HttpMtpError
-from .http_mtp import HttpMtpServer, start_server
+from .http_mtp import HttpMtpServer, SharedMtpHost, start_server
 from .multipart import build_multipart
 
 __all__ = [
     "HttpMtpClient",
     "HttpMtpError",
     "HttpMtpServer",
+    "SharedMtpHost",
     "start_server",
     "build_multipart",
 ]
@@ -22,7 +22,11 @@ Asynchronous FIPA HTTP-MTP client.
 This client packages an ACL message + transport envelope into a
 ``multipart/mixed`` body and POSTs it to a remote ACC (Agent Communication
 Channel). It implements exponential backoff with jitter and reuses a single
-``aiohttp.ClientSession`` for efficiency.
+``aiohttp.ClientSession`` for efficiency; its connection pool keeps idle
+connections alive, so repeated sends to an ACC that allows keep-alive skip
+TCP setup. Peers running peak-acl's own
+:class:`~peak_acl.transport.http_mtp.HttpMtpServer` answer with
+``Connection: close``, so each send to them still opens a new connection.
 
 Public API
 ----------
@@ -75,6 +79,16 @@ class HttpMtpClient:
     session :
         Optional externally managed ``aiohttp.ClientSession``. If omitted, this
         class creates and owns one (and will close it on ``close()``).
+    limit :
+        Max simultaneous connections of the owned session (default: 100).
+    limit_per_host :
+        Max simultaneous connections per ACC host; ``0`` means no per-host
+        cap (default).
+    keepalive_timeout :
+        Seconds an idle connection is kept for reuse (default: ``None``,
+        aiohttp's own default).
+
+    The pool settings only apply when this class creates the session.
 
     Notes
     -----
@@ -95,14 +109,23 @@ class HttpMtpClient:
         backoff_cap: float = 4.0,
         timeout: float = 10.0,
         session: Optional[aiohttp.ClientSession] = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: Optional[float] = None,
     ):
         self.retries = retries
         self.backoff_base = backoff_base
         self.backoff_cap = backoff_cap
         self._owns_session = session is None
-        self.session = session or aiohttp.ClientSession(
-            timeout=ClientTimeout(total=timeout)
-        )
+        if session is None:
+            pool: dict = {"limit": limit, "limit_per_host": limit_per_host}
+            if keepalive_timeout is not None:
+                pool["keepalive_timeout"] = keepalive_timeout
+            session = aiohttp.ClientSession(
+                timeout=ClientTimeout(total=timeout),
+                connector=aiohttp.TCPConnector(**pool),
+            )
+        self.session = session
 
     # ------------------------------------------------------------------ #
     async def send(
@@ -111,6 +134,8 @@ class HttpMtpClient:
         from_ai: AgentIdentifier,
         acl_msg: AclMessage,
         acc_url: str,
+        *,
+        acl_text: Optional[str] = None,
     ) -> None:
         """Send a single ACL message to the ACC via HTTP POST.
 
@@ -124,6 +149,9 @@ class HttpMtpClient:
             ACL message to serialize and include as payload.
         acc_url :
             ACC endpoint URL (HTTP-MTP).
+        acl_text :
+            Optional pre-serialized ACL text for *acl_msg*; see
+            :func:`build_multipart`.
 
         Raises
         ------
@@ -137,7 +165,7 @@ class HttpMtpClient:
         * On non-200 responses, the first 256 chars of the body are included to
           aid debugging without flooding logs.
         """
-        body, ctype = build_multipart(to_ai, from_ai, acl_msg)
+        body, ctype = build_multipart(to_ai, from_ai, acl_msg, acl_text=acl_text)
         headers = {
             "Content-Type": ctype,
             "Cache-Control": "no-cache",
@@ -40,22 +40,28 @@ JADE traffic, causing JADE's Deliverer threads to block (“Deliverer stuck”).
 This implementation:
 
 * Reads the raw body (``await request.read()``).
-* Extracts the boundary via regex.
+* Extracts the boundary from the Content-Type header.
 * Parses multipart manually, tolerating variations.
 * Identifies envelope/ACL by Content-Type + heuristics.
 * Replies **immediately** with HTTP 200 to JADE; parsing happens in background.
+  When the bounded ``inbox`` is full, the reply is held until the message is
+  queued, so TCP flow control slows the peer down instead of memory growing.
 * On error, logs a snippet and discards (does not block JADE).
 * Delivers ``(Envelope, AclMessage)`` to a callback ``on_message`` or to
   an internal ``inbox`` queue.
 
-A helper :func:`start_server` is provided for runtime integration.
+A helper :func:`start_server` is provided for runtime integration, and
+:class:`SharedMtpHost` lets several local agents share one server/port.
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import re
+import socket
+from concurrent.futures import Executor
 from typing import TYPE_CHECKING, Awaitable, Callable, Optional, Tuple
 
 from aiohttp import web
@@ -67,7 +73,7 @@ from ..util.async_utils import safe_create_task  # background task wrapper
 if TYPE_CHECKING:  # mypy / pylance only
     from ..message.acl import AclMessage
 
-__all__ = ["HttpMtpServer", "start_server"]
+__all__ = ["HttpMtpServer", "SharedMtpHost", "start_server"]
 _NOSET = object()  # sentinel (currently unused; kept for future configs)
 
 _LOG = logging.getLogger("peak_acl.http_mtp")
@@ -76,8 +82,17 @@ _LOG = logging.getLogger("peak_acl.http_mtp")
 # Config
 # --------------------------------------------------------------------------- #
 MAX_REQUEST_SIZE = 5 * 1024 * 1024  # 5 MiB
+MAX_INBOX = 1024  # queued (Envelope, AclMessage) pairs; 0 = unbounded
+# Bodies of at least this many bytes are parsed off the event loop.
+OFFLOAD_MIN_SIZE = 4096
 ACC_ENDPOINT = "/acc"
 _BOUNDARY_RE = re.compile(r'boundary="?([^";]+)"?', re.IGNORECASE)
+# Part-kind heuristics: anchored matches skip leading whitespace in place
+# instead of ``lstrip()``-copying the whole body.
+_XML_START_RE = re.compile(rb"\s*<\?xml")
+_ACL_START_RE = re.compile(rb"\s*\(")
+_LEADING_WS_RE = re.compile(rb"\s*")
+_ASCII_WS = frozenset(b" \t\n\r\x0b\x0c")
 
 
 # --------------------------------------------------------------------------- #
@@ -90,45 +105,94 @@ def _split_parts(raw: bytes, boundary_bytes: bytes) -> list[Tuple[bytes, bytes]]
     ``Content-Transfer-Encoding`` or other headers.
     """
     marker = b"--" + boundary_bytes
-    end_marker = marker + b"--"  # not explicitly used; kept for clarity
+    step = len(marker)
 
     # Normalize: trim surrounding whitespace / extra CRLF
     data = raw.strip()
-
-    # Split by each marker occurrence (final marker included)
-    chunks = data.split(marker)
-
+    find = data.find
+
+    # Fast path for the usual JADE shape ``--B <part> --B <part> --B--``:
+    # three finds and two slices, no loop.
+    end = len(data) - step - 2
+    if end > step and data.startswith(marker) and data.endswith(b"--"):
+        mid = find(marker, step)
+        if 0 < mid and find(marker, mid + step) == end:
+            first = data[step:mid].strip()
+            second = data[mid + step : end].strip()
+            if first and first != b"--" and second and second != b"--":
+                return [_split_part(first), _split_part(second)]
+
+    # Walk the chunks between marker occurrences (final marker included)
+    # with one cursor instead of materializing ``data.split(marker)``.
     parts: list[Tuple[bytes, bytes]] = []
-    for chunk in chunks:
-        c = chunk.strip()
-        if not c or c == b"--":
-            continue
-        if c.startswith(b"--"):  # final part marker (--BOUNDARY--)
-            c = c[2:].lstrip()
-
-        # Separate headers/body: prefer CRLF, fallback LF
-        if b"\r\n\r\n" in c:
-            hdr, body = c.split(b"\r\n\r\n", 1)
-        elif b"\n\n" in c:
-            hdr, body = c.split(b"\n\n", 1)
+    append = parts.append
+    start = 0
+    while True:
+        nxt = find(marker, start)
+        c = data[start:nxt].strip() if nxt >= 0 else data[start:].strip()
+        if c and c != b"--":
+            append(_split_part(c))
+        if nxt < 0:
+            return parts
+        start = nxt + step
+
+
+def _split_part(c: bytes) -> Tuple[bytes, bytes]:
+    """Split one stripped, non-empty chunk into ``(headers, body)``."""
+    if c.startswith(b"--"):  # final part marker (--BOUNDARY--)
+        c = c[2:].lstrip()
+
+    # Separate headers/body: prefer CRLF, fallback LF
+    i = c.find(b"\r\n\r\n")
+    if i >= 0:
+        hdr, body = c[:i], c[i + 4 :]
+    else:
+        i = c.find(b"\n\n")
+        if i >= 0:
+            hdr, body = c[:i], c[i + 2 :]
         else:
             hdr, body = b"", c
 
-        # Trim trailing CR/LF before next boundary
-        body = body.rstrip(b"\r\n")
-        parts.append((hdr, body))
+    # Trim trailing CR/LF before next boundary
+    return hdr, body.rstrip(b"\r\n")
 
-    return parts
+
+@functools.lru_cache(maxsize=256)
+def _parse_boundary(ctype: str) -> Optional[bytes]:
+    """Return the ``boundary`` parameter of a Content-Type value, or ``None``.
+
+    The lowercase ``boundary=`` spelling every agent sends is handled with a
+    plain ``partition``; other spellings fall back to ``_BOUNDARY_RE``.
+    Memoized: a JADE platform typically reuses one boundary per session.
+    """
+    _, sep, rest = ctype.partition("boundary=")
+    if sep:
+        if rest[:1] == '"':
+            rest = rest[1:]
+        value = rest.split(";", 1)[0].split('"', 1)[0]
+        if value:
+            return value.encode("utf-8", "ignore")
+    m = _BOUNDARY_RE.search(ctype)
+    return m.group(1).encode("utf-8", "ignore") if m else None
+
+
+def _has_type(hdr: bytes, ctype: bytes) -> bool:
+    """Case-insensitive ``ctype in hdr``; *ctype* must be lowercase.
+
+    Headers are nearly always lowercase already, so the copy made by
+    ``lower()`` is only paid when the direct search misses.
+    """
+    return ctype in hdr or ctype in hdr.lower()
 
 
 def _guess_is_envelope(body: bytes) -> bool:
     """Heuristic: envelope starts with XML declaration."""
-    return body.lstrip().startswith(b"<?xml")
+    return _XML_START_RE.match(body) is not None
 
 
 def _guess_is_acl(body: bytes) -> bool:
     """Heuristic: JADE ACL strings start with '(' (ignore leading whitespace)."""
-    return body.lstrip().startswith(b"(")
+    return _ACL_START_RE.match(body) is not None
 
 
 def _extract_envelope_acl(raw: bytes, boundary_bytes: bytes) -> Tuple[str, str]:
@@ -141,16 +205,24 @@ def _extract_envelope_acl(raw: bytes, boundary_bytes: bytes) -> Tuple[str, str]:
     if len(parts) < 2:
         raise ValueError(f"multipart inesperado (<2 partes); partes={len(parts)}")
 
+    # JADE shape: envelope then ACL, both typed; the steps below would pick
+    # exactly these two bodies.
+    if (
+        len(parts) == 2
+        and _has_type(parts[0][0], b"application/xml")
+        and _has_type(parts[1][0], b"text/plain")
+    ):
+        return _decode_envelope_acl(parts[0][1], parts[1][1])
+
     env_bytes: Optional[bytes] = None
     acl_bytes: Optional[bytes] = None
 
     # 1) Prefer Content-Type if present
     for hdr, body in parts:
-        hlow = hdr.lower()
-        if (b"application/xml" in hlow) and (env_bytes is None):
+        if (env_bytes is None) and _has_type(hdr, b"application/xml"):
             env_bytes = body
             continue
-        if (b"text/plain" in hlow) and (acl_bytes is None):
+        if (acl_bytes is None) and _has_type(hdr, b"text/plain"):
             acl_bytes = body
             continue
 
@@ -175,9 +247,14 @@ def _extract_envelope_acl(raw: bytes, boundary_bytes: bytes) -> Tuple[str, str]:
         else:
             acl_bytes = parts[-1][1]
 
+    return _decode_envelope_acl(env_bytes, acl_bytes)
+
+
+def _decode_envelope_acl(env_bytes: bytes, acl_bytes: bytes) -> Tuple[str, str]:
+    """Decode the chosen parts, swapping them back if they look inverted."""
     # Decode to text
-    env_txt = env_bytes.decode("utf-8", errors="replace").strip()
-    acl_txt = acl_bytes.decode("utf-8", errors="replace").strip()
+    env_txt = _strip_decode(env_bytes)
+    acl_txt = _strip_decode(acl_bytes)
 
     # Sanity swap: if ACL/envelope seem inverted
     if (
@@ -190,6 +267,41 @@ def _extract_envelope_acl(raw: bytes, boundary_bytes: bytes) -> Tuple[str, str]:
     return env_txt, acl_txt
 
 
+def _strip_decode(body: bytes) -> str:
+    """Same as ``body.decode("utf-8", errors="replace").strip()``.
+
+    ASCII whitespace around the part is skipped before decoding (the JADE
+    body starts with a blank line), so the decoded text is not copied again
+    by ``strip()``; the final ``strip()`` only handles non-ASCII whitespace.
+    """
+    n = len(body)
+    # Small or already-trimmed parts: one extra copy is cheaper than the scan.
+    if n < 1024 or (body[0] not in _ASCII_WS and body[-1] not in _ASCII_WS):
+        return body.decode("utf-8", errors="replace").strip()
+    i = _LEADING_WS_RE.match(body).end()
+    j = n
+    while j > i and body[j - 1] in _ASCII_WS:
+        j -= 1
+    return str(memoryview(body)[i:j], "utf-8", "replace").strip()
+
+
+def _parse_raw(raw: bytes, boundary_bytes: bytes) -> Tuple[Envelope, "AclMessage"]:
+    """Parse a raw multipart body into ``(Envelope, AclMessage)`` (sync)."""
+    env_txt, acl_txt = _extract_envelope_acl(raw, boundary_bytes)
+
+    # Debug snippets
+    _LOG.debug(
+        "MTP RAW (%dB) env=%dB acl=%dB",
+        len(raw),
+        len(env_txt),
+        len(acl_txt),
+    )
+    _LOG.debug("MTP ENV snippet: %s", env_txt[:80].replace("\n", " "))
+    _LOG.debug("MTP ACL snippet: %s", acl_txt[:80].replace("\n", " "))
+
+    return Envelope.from_xml(env_txt), parse_acl(acl_txt)
+
+
 # --------------------------------------------------------------------------- #
 # Main server class
 # --------------------------------------------------------------------------- #
@@ -203,8 +315,17 @@ class HttpMtpServer:
         If ``None``, messages are queued into :py:attr:`inbox`.
     client_max_size :
         Max accepted request size in bytes (default: 5 MiB).
+    max_inbox :
+        Capacity of :py:attr:`inbox` (default: 1024; ``0`` means unbounded).
     loop :
         Optional event loop to bind to ``aiohttp`` app (deprecated in aiohttp>=3.8).
+    executor :
+        Executor that parses bodies of at least :data:`OFFLOAD_MIN_SIZE` bytes
+        (the loop's default one if ``None``).
+    backlogged :
+        Optional predicate telling whether the consumer behind *on_message*
+        is lagging; while it returns ``True``, requests are handled inline
+        like with a full :py:attr:`inbox`.
 
     Attributes
     ----------
@@ -216,7 +337,10 @@ class HttpMtpServer:
     Notes
     -----
     * The server answers 200 OK immediately, then parses in a background task to
-      avoid blocking JADE deliverers.
+      avoid blocking JADE deliverers. If :py:attr:`inbox` is full (or
+      *backlogged* returns ``True``), the request is processed inline and the
+      reply is sent only after the message is delivered (back-pressure on the
+      sender).
     * Errors during parsing are logged and ignored (message is dropped).
     """
 
@@ -227,10 +351,17 @@ class HttpMtpServer:
         ] = None,
         *,
         client_max_size: int = MAX_REQUEST_SIZE,
+        max_inbox: int = MAX_INBOX,
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        executor: Optional[Executor] = None,
+        backlogged: Optional[Callable[[], bool]] = None,
     ):
         self._on_message = on_message
-        self.inbox: "asyncio.Queue[tuple[Envelope, AclMessage]]" = asyncio.Queue()
+        self._executor = executor
+        self._backlogged = backlogged
+        self.inbox: "asyncio.Queue[tuple[Envelope, AclMessage]]" = asyncio.Queue(
+            maxsize=max_inbox
+        )
 
         # aiohttp >=3.8 discourages passing loop; keep for backward compat
         if loop is not None:
@@ -238,46 +369,40 @@ class HttpMtpServer:
         else:
             self.app = web.Application(client_max_size=client_max_size)
 
-        # Middlewares
-        self.app.middlewares.extend([self._logging_middleware, self._error_middleware])
-
         # /acc route
         self.app.router.add_post(ACC_ENDPOINT, self._handle_post)
 
     # ------------------------------------------------------------------ #
-    # Middlewares
+    # /acc handler
     # ------------------------------------------------------------------ #
-    @web.middleware
-    async def _logging_middleware(self, request: web.Request, handler):
-        """Log method/path/remote/status for each request."""
-        resp = await handler(request)
-        _LOG.info(
-            "%s %s ← %s → %s",
-            request.method,
-            request.path_qs,
-            request.remote,
-            resp.status,
-        )
-        return resp
+    async def _handle_post(self, request: web.Request) -> web.StreamResponse:
+        """Handle incoming POSTs to the ACC endpoint (non-blocking).
 
-    @web.middleware
-    async def _error_middleware(self, request: web.Request, handler):
-        """Convert unexpected exceptions to HTTP 500 and log the traceback."""
+        Logging and error handling live here rather than in aiohttp
+        middlewares: ``/acc`` is the only route, so the per-request
+        middleware chain was pure overhead.  Unexpected exceptions are
+        logged and turned into HTTP 500.
+        """
         try:
-            return await handler(request)
+            raw = await request.read()
+            ctype = request.headers.get("Content-Type", "")
+            boundary_bytes = _parse_boundary(ctype)
+            if boundary_bytes is None:
+                _LOG.error("Sem boundary em Content-Type: %s", ctype)
+            elif self._lagging():
+                # Consumer is lagging: answer only once the message is queued.
+                await self._process_raw(raw, boundary_bytes)
+            else:
+                # Process in background (use safe_create_task to log exceptions)
+                safe_create_task(
+                    self._process_raw(raw, boundary_bytes), name="mtp_process_raw"
+                )
         except web.HTTPException:
             raise
         except Exception as exc:  # pragma: no cover
             _LOG.exception("Erro não tratado no HTTP-MTP")
             raise web.HTTPInternalServerError(text="internal error") from exc
 
-    # ------------------------------------------------------------------ #
-    # /acc handler
-    # ------------------------------------------------------------------ #
-    async def _handle_post(self, request: web.Request) -> web.StreamResponse:
-        """Handle incoming POSTs to the ACC endpoint (non-blocking)."""
-        raw = await request.read()
-
         # Immediate response (do not block JADE)
         resp = web.Response(
             text="ok",
@@ -285,40 +410,37 @@ class HttpMtpServer:
             content_type="text/plain",
             headers={"Cache-Control": "no-cache", "Connection": "close"},
         )
-
-        ctype = request.headers.get("Content-Type", "")
-        m = _BOUNDARY_RE.search(ctype)
-        if not m:
-            _LOG.error("Sem boundary em Content-Type: %s", ctype)
-            return resp
-
-        boundary_bytes = m.group(1).encode("utf-8", "ignore")
-
-        # Process in background (use safe_create_task to log exceptions)
-        safe_create_task(self._process_raw(raw, boundary_bytes), name="mtp_process_raw")
+        _LOG.info(
+            "%s %s ← %s → %s",
+            request.method,
+            request.path_qs,
+            request.remote,
+            resp.status,
+        )
         return resp
 
+    def _lagging(self) -> bool:
+        """``True`` when deliveries should hold the reply (back-pressure)."""
+        if self._on_message is None:
+            return self.inbox.full()
+        return self._backlogged is not None and self._backlogged()
+
     # ------------------------------------------------------------------ #
     async def _process_raw(self, raw: bytes, boundary_bytes: bytes) -> None:
         """Parse raw multipart into Envelope + AclMessage and deliver it.
 
-        Runs in a separate Task.
+        Runs in a separate Task; bodies of at least :data:`OFFLOAD_MIN_SIZE`
+        bytes are parsed in the executor so the loop keeps serving requests.
         """
         try:
-            env_txt, acl_txt = _extract_envelope_acl(raw, boundary_bytes)
-
-            # Debug snippets
-            _LOG.debug(
-                "MTP RAW (%dB) env=%dB acl=%dB",
-                len(raw),
-                len(env_txt),
-                len(acl_txt),
-            )
-            _LOG.debug("MTP ENV snippet: %s", env_txt[:80].replace("\n", " "))
-            _LOG.debug("MTP ACL snippet: %s", acl_txt[:80].replace("\n", " "))
-
-            env = Envelope.from_xml(env_txt)
-            acl = parse_acl(acl_txt)
+            if len(raw) < OFFLOAD_MIN_SIZE:
+                env, acl = _parse_raw(raw, boundary_bytes)
+            else:
+                # One hop for the whole split + XML + ACL parse.
+                loop = asyncio.get_running_loop()
+                env, acl = await loop.run_in_executor(
+                    self._executor, _parse_raw, raw, boundary_bytes
+                )
 
         except ValueError as exc:
             # Known parse/format error
@@ -377,21 +499,34 @@ async def start_server(
     port: int = 7777,
     loop: Optional[asyncio.AbstractEventLoop] = None,
     client_max_size: int = MAX_REQUEST_SIZE,
-) -> tuple[HttpMtpServer, web.AppRunner, web.TCPSite]:
+    max_inbox: int = MAX_INBOX,
+    sock: Optional[socket.socket] = None,
+    backlogged: Optional[Callable[[], bool]] = None,
+) -> tuple[HttpMtpServer, web.AppRunner, web.BaseSite]:
     """Convenience bootstrap for the HTTP-MTP server.
 
     Returns the server instance plus the runner/site objects so the caller can
     later stop/cleanup them if needed.
+
+    When *sock* is given, the server listens on that already-bound socket
+    (``bind_host``/``port`` are ignored), which avoids a probe-then-bind race
+    when the caller needs an ephemeral port.
     """
     server = HttpMtpServer(
         on_message=on_message,
         client_max_size=client_max_size,
+        max_inbox=max_inbox,
         loop=loop,
+        backlogged=backlogged,
     )
 
     server._runner = web.AppRunner(server.app)
     await server._runner.setup()
-    server._site = web.TCPSite(server._runner, bind_host, port)
+    if sock is not None:
+        bind_host, port = sock.getsockname()[:2]
+        server._site = web.SockSite(server._runner, sock)
+    else:
+        server._site = web.TCPSite(server._runner, bind_host, port)
     await server._site.start()
 
     _LOG.info(
@@ -401,6 +536,105 @@ async def start_server(
     return server, server._runner, server._site
 
 
+# --------------------------------------------------------------------------- #
+# SharedMtpHost – one server for many local agents
+# --------------------------------------------------------------------------- #
+class SharedMtpHost:
+    """Single HTTP-MTP server shared by several local agents.
+
+    Instead of one ``AppRunner``/``TCPSite`` per agent, every agent attached
+    here gets its own inbox queue and inbound messages are routed by the
+    envelope's ``to`` name.
+
+    Parameters
+    ----------
+    bind_host, port, client_max_size :
+        Forwarded to :func:`start_server`.
+    max_inbox :
+        Capacity of each per-agent inbox (``0`` means unbounded).
+
+    Notes
+    -----
+    * Messages addressed to an agent that is not attached are logged and
+      dropped, like any other undeliverable message.
+    * While any attached inbox is full, requests are processed inline and
+      answered once delivered, as :class:`HttpMtpServer` does for its own
+      inbox, so routing tasks cannot pile up behind a lagging agent.
+    * Call :meth:`start` once (``start_endpoint`` does it on first use) and
+      :meth:`close` when every agent is done.
+    """
+
+    def __init__(
+        self,
+        *,
+        bind_host: str = "0.0.0.0",
+        port: int = 7777,
+        client_max_size: int = MAX_REQUEST_SIZE,
+        max_inbox: int = MAX_INBOX,
+    ):
+        self.bind_host = bind_host
+        self.port = port
+        self.client_max_size = client_max_size
+        self.max_inbox = max_inbox
+        self.server: Optional[HttpMtpServer] = None
+        self.runner: Optional[web.AppRunner] = None
+        self.site: Optional[web.BaseSite] = None
+        self._inboxes: dict[str, asyncio.Queue] = {}
+        self._start_lock: Optional[asyncio.Lock] = None  # made on first start()
+
+    # ------------------------------------------------------------------ #
+    @property
+    def started(self) -> bool:
+        """``True`` once :meth:`start` has bound the listening socket."""
+        return self.server is not None
+
+    async def start(self) -> None:
+        """Bind the shared server (idempotent, safe to call concurrently)."""
+        if self.started:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self.started:  # another caller bound it while we waited
+                return
+            self.server, self.runner, self.site = await start_server(
+                on_message=self._route,
+                bind_host=self.bind_host,
+                port=self.port,
+                client_max_size=self.client_max_size,
+                backlogged=self._backlogged,
+            )
+
+    def attach(self, name: str) -> "asyncio.Queue[tuple[Envelope, AclMessage]]":
+        """Register agent *name* and return its inbox queue."""
+        if name in self._inboxes:
+            raise ValueError(f"AID já ligado ao host partilhado: {name}")
+        inbox: asyncio.Queue = asyncio.Queue(maxsize=self.max_inbox)
+        self._inboxes[name] = inbox
+        return inbox
+
+    def detach(self, name: str) -> None:
+        """Stop routing messages to agent *name* (no-op if unknown)."""
+        self._inboxes.pop(name, None)
+
+    async def close(self) -> None:
+        """Stop the shared server."""
+        if self.server is not None:
+            await self.server.close()
+        self.server = self.runner = self.site = None
+
+    # ------------------------------------------------------------------ #
+    def _backlogged(self) -> bool:
+        return any(inbox.full() for inbox in self._inboxes.values())
+
+    async def _route(self, env: Envelope, acl: "AclMessage") -> None:
+        inbox = self._inboxes.get(env.to_.name)
+        if inbox is None:
+            _LOG.warning("Sem agente local %r; mensagem descartada.", env.to_.name)
+            return
+        await inbox.put((env, acl))
+
+
 # --------------------------------------------------------------------------- #
 # Stand-alone debug
 # --------------------------------------------------------------------------- #
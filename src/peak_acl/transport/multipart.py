@@ -27,9 +27,9 @@ value (including the generated boundary).
 
 from __future__ import annotations
 
-import uuid
+import secrets
 from datetime import datetime, timezone
-from typing import Tuple
+from typing import Optional, Tuple
 
 from ..message.acl import AclMessage
 from ..message.aid import AgentIdentifier
@@ -41,6 +41,10 @@ from ..message.serialize import dumps
 # --------------------------------------------------------------------------- #
 CRLF = "\r\n"
 
+# Part headers plus the blank separator lines JADE expects before each body.
+_ENV_HEADERS = b"Content-Type: application/xml\r\n\r\n\r\n"
+_ACL_HEADERS = b"Content-Type: text/plain\r\n\r\n\r\n"
+
 
 # --------------------------------------------------------------------------- #
 # Public API
@@ -49,6 +53,9 @@ def build_multipart(
     to_ai: AgentIdentifier,
     from_ai: AgentIdentifier,
     msg: AclMessage,
+    *,
+    acl_text: Optional[str] = None,
+    boundary: Optional[str] = None,
 ) -> Tuple[bytes, str]:
     """Build a JADE-style ``multipart/mixed`` body (bytes) and its Content-Type.
 
@@ -60,6 +67,13 @@ def build_multipart(
         Sender agent identifier for the envelope.
     msg :
         ACL message to serialize into the second part.
+    acl_text :
+        Optional pre-serialized form of *msg* (``dumps(msg)``). Lets callers
+        that send the same message to several receivers serialize it once.
+    boundary :
+        Optional multipart boundary to use instead of a fresh random one;
+        callers sending a burst of messages can generate it once. It must
+        not occur in the envelope or ACL text.
 
     Returns
     -------
@@ -71,32 +85,33 @@ def build_multipart(
     -----
     * The envelope is serialized first as ``application/xml``, followed by the
       ACL payload as ``text/plain``.
-    * Boundary is generated with a random UUID prefix to minimize collisions.
+    * Boundary is generated with a random hex suffix to minimize collisions.
     """
-    acl_str = dumps(msg)
+    acl_str = dumps(msg) if acl_text is None else acl_text
+    acl_bytes = acl_str.encode("utf-8")
     env_xml = Envelope(
         to_=to_ai,
         from_=from_ai,
         date=datetime.now(timezone.utc),
-        payload_length=len(acl_str.encode()),
+        payload_length=len(acl_bytes),
     ).to_xml()
 
-    boundary = f"BOUNDARY-{uuid.uuid4().hex[:12]}"
+    if boundary is None:
+        boundary = "BOUNDARY-" + secrets.token_hex(6)
+    marker = f"--{boundary}{CRLF}".encode("ascii")
 
-    parts = [
-        "--" + boundary,
-        "Content-Type: application/xml",
-        "",
-        "",
-        env_xml,
-        "--" + boundary,
-        "Content-Type: text/plain",
-        "",
-        "",
-        acl_str,
-        f"--{boundary}--",
-        "",
-    ]
-    body = CRLF.join(parts).encode("utf-8")
+    # Both payloads are encoded exactly once and copied once into the body.
+    body = b"".join(
+        (
+            marker,
+            _ENV_HEADERS,
+            env_xml.encode("utf-8"),
+            b"\r\n",
+            marker,
+            _ACL_HEADERS,
+            acl_bytes,
+            f"{CRLF}--{boundary}--{CRLF}".encode("ascii"),
+        )
+    )
     ctype = f'multipart/mixed; boundary="{boundary}"'
     return body, ctype
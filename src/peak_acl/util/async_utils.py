@@ -61,17 +61,27 @@ def safe_create_task(coro, *, name: str | None = None) -> asyncio.Task:
     --------
     A ``done_callback`` inspects the task; if it finished with an exception
     (and was not merely cancelled), the exception is logged with a traceback
-    via ``log.exception``. Cancellation is ignored.
+    via ``log.exception`` under *name*, or under the coroutine when no name
+    was given. Cancellation is ignored.
     """
     task = asyncio.create_task(coro, name=name)
+    task.add_done_callback(_log_task_exc if name is not None else _log_coro_exc)
+    return task
 
-    def _done(t: asyncio.Task):
-        try:
-            exc = t.exception()
-        except asyncio.CancelledError:
-            return
-        if exc:
-            log.exception("Background task %s failed", name or coro, exc_info=exc)
 
-    task.add_done_callback(_done)
-    return task
+def _log_task_exc(t: asyncio.Task) -> None:
+    """Done-callback shared by every named :func:`safe_create_task` task."""
+    _report(t, t.get_name())
+
+
+def _log_coro_exc(t: asyncio.Task) -> None:
+    """Same for unnamed tasks: ``Task-N`` would not identify the coroutine."""
+    _report(t, t.get_coro())
+
+
+def _report(t: asyncio.Task, label) -> None:
+    if t.cancelled():
+        return
+    exc = t.exception()
+    if exc:
+        log.exception("Background task %s failed", label, exc_info=exc)
@@ -0,0 +1,39 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Santiago Bossa
+#
+# This file is part of peak-acl.
+#
+# peak-acl is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# peak-acl is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with peak-acl.  If not, see the LICENSE file in the project root.
+
+"""
+Python-version compatibility shims.
+
+``DATACLASS_SLOTS`` expands to ``{"slots": True}`` on Python ≥ 3.10 and to an
+empty dict on 3.9, so hot dataclasses can be declared as
+
+.. code-block:: python
+
+   @dataclass(**DATACLASS_SLOTS)
+   class Foo: ...
+
+and get ``__slots__`` wherever the interpreter supports it.
+"""
+
+from __future__ import annotations
+
+import sys
+
+__all__ = ["DATACLASS_SLOTS"]
+
+DATACLASS_SLOTS: dict = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -25,13 +25,20 @@ address by opening a UDP socket to a public endpoint (8.8.8.8:80). No packets
 are actually sent; the OS chooses the outbound interface and we read that local
 address. If that fails, a best-effort hostname lookup is used, finally falling
 back to ``127.0.0.1``.
+
+The detected address is cached for the process; :func:`invalidate_discover_ip`
+forces the next call to detect it again.
 """
 
 from __future__ import annotations
 
 import socket
+from typing import Optional
+
+__all__ = ["discover_ip", "invalidate_discover_ip"]
 
-__all__ = ["discover_ip"]
+_LOOPBACK = "127.0.0.1"
+_CACHED_IP: Optional[str] = None
 
 
 # --------------------------------------------------------------------------- #
@@ -57,16 +64,35 @@ def discover_ip() -> str:
     * No packet is actually transmitted during step 1.
     * IPv6-only environments are not covered; consider adding an IPv6 variant
       if needed.
+    * The first detected address is cached and returned by later calls. The
+      ``127.0.0.1`` fallback is never cached, so a host that starts offline
+      picks up its real address once the network comes up.
     """
-    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    try:
-        s.connect(("8.8.8.8", 80))
-        return s.getsockname()[0]
-    except OSError:
-        # Fallback if the connect()/getsockname() path fails (e.g., offline box)
+    global _CACHED_IP
+    ip = _CACHED_IP
+    if ip is None:
+        ip = _detect_ip()
+        if ip != _LOOPBACK:
+            _CACHED_IP = ip
+    return ip
+
+
+def invalidate_discover_ip() -> None:
+    """Drop the cached address (e.g. after a network change)."""
+    global _CACHED_IP
+    _CACHED_IP = None
+
+
+def _detect_ip() -> str:
+    """Run the detection strategy described in :func:`discover_ip`."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
         try:
-            return socket.gethostbyname(socket.gethostname())
-        except Exception:
-            return "127.0.0.1"  # Final fallback to localhost
-    finally:
-        s.close()
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+        except OSError:
+            pass
+    # Fallback if the connect()/getsockname() path fails (e.g., offline box)
+    try:
+        return socket.gethostbyname(socket.gethostname())
+    except Exception:
+        return _LOOPBACK  # Final fallback to localhost
@@ -34,7 +34,9 @@ async def test_register_deregister_and_search_build_messages():
     assert "register" in reg.content
 
     der = await df_manager.deregister(my_aid=my, df_aid=df, http_client=client)
-    assert "deregister" in der.content
+    assert der.content == sl0.dumps(
+        sl0.Action(actor=df, act=sl0.Deregister(sl0.DfAgentDescription(name=my)))
+    )
 
     search = await df_manager.search_services(
         my_aid=my,
@@ -114,6 +116,25 @@ def test_decode_df_reply_list_path_and_failure_helpers(monkeypatch):
     assert df_manager.is_df_failure_msg(msg) is True
 
 
+def test_df_predicates_reject_other_heads_without_decoding(monkeypatch):
+    sl = "fipa-sl0"
+    done = AclMessage("inform", content=" ( (DONE (action df x)))", language=sl)
+    failure = AclMessage("failure", content="((failure x))", language=sl)
+    assert df_manager.is_df_done_msg(done) is True
+    assert df_manager.is_df_failure_msg(failure) is True
+
+    def _no_decode(_msg):
+        raise AssertionError("decode_content should not run")
+
+    monkeypatch.setattr(df_manager, "decode_content", _no_decode)
+    result = AclMessage("inform", content="((result (done x) (set)))", language=sl)
+    assert df_manager.is_df_done_msg(result) is False
+    assert df_manager.is_df_failure_msg(result) is False
+    assert (
+        df_manager.is_df_done_msg(AclMessage("inform", content="(doneness)")) is False
+    )
+
+
 def test_extract_search_results_from_value_with_rebuild_and_unknown():
     aid_expr = [
         "agent-identifier",
@@ -4,7 +4,8 @@ import socket
 import pytest
 
 from peak_acl.message import AclMessage, AgentIdentifier
-from peak_acl.transport import HttpMtpClient, start_server
+from peak_acl.runtime import start_endpoint
+from peak_acl.transport import HttpMtpClient, SharedMtpHost, start_server
 
 
 def _free_port():
@@ -13,17 +14,30 @@ def _free_port():
         return s.getsockname()[1]
 
 
+@pytest.fixture
+def bound_socket():
+    """An ephemeral-port socket the server can listen on without re-binding."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        yield s
+
+
+async def _wait_full(queue):
+    while not queue.full():
+        await asyncio.sleep(0.01)
+
+
 @pytest.mark.asyncio
-async def test_http_client_server_roundtrip():
+async def test_http_client_server_roundtrip(bound_socket):
     received = []
+    delivered = asyncio.Event()
 
     async def on_msg(env, acl):
         received.append((env, acl))
+        delivered.set()
 
-    port = _free_port()
-    server, runner, site = await start_server(
-        on_message=on_msg, bind_host="127.0.0.1", port=port
-    )
+    port = bound_socket.getsockname()[1]
+    server, runner, site = await start_server(on_message=on_msg, sock=bound_socket)
 
     try:
         async with HttpMtpClient(retries=0) as client:
@@ -35,7 +49,7 @@ async def test_http_client_server_roundtrip():
             )
             msg = AclMessage("inform", content="ping")
             await client.send(to_ai, from_ai, msg, f"http://127.0.0.1:{port}/acc")
-            await asyncio.sleep(0.1)
+            await asyncio.wait_for(delivered.wait(), timeout=2.0)
     finally:
         await server.close()
 
@@ -43,3 +57,136 @@ async def test_http_client_server_roundtrip():
     env, acl = received[0]
     assert acl.content == "ping"
     assert env.to_.name == to_ai.name
+
+
+@pytest.mark.asyncio
+async def test_full_inbox_holds_reply_until_queued(bound_socket):
+    port = bound_socket.getsockname()[1]
+    server, runner, site = await start_server(sock=bound_socket, max_inbox=1)
+    url = f"http://127.0.0.1:{port}/acc"
+    to_ai = AgentIdentifier(f"receiver@localhost:{port}/JADE", [url])
+    from_ai = AgentIdentifier("sender@localhost:1/JADE", ["http://127.0.0.1:1/acc"])
+
+    try:
+        async with HttpMtpClient(retries=0) as client:
+            await client.send(to_ai, from_ai, AclMessage("inform", content="a"), url)
+            await asyncio.wait_for(_wait_full(server.inbox), timeout=1)
+
+            second = asyncio.create_task(
+                client.send(to_ai, from_ai, AclMessage("inform", content="b"), url)
+            )
+            await asyncio.sleep(0.1)
+            assert not second.done()
+
+            _, first = server.inbox.get_nowait()
+            await asyncio.wait_for(second, timeout=1)
+            _, queued = server.inbox.get_nowait()
+    finally:
+        await server.close()
+
+    assert (first.content, queued.content) == ("a", "b")
+
+
+@pytest.mark.asyncio
+async def test_shared_host_routes_to_attached_endpoints():
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/acc"
+    host = SharedMtpHost(bind_host="127.0.0.1", port=port)
+    alice = AgentIdentifier("alice@localhost/JADE", [url])
+    bob = AgentIdentifier("bob@localhost/JADE", [url])
+
+    ep_a = await start_endpoint(my_aid=alice, shared_host=host)
+    ep_b = await start_endpoint(my_aid=bob, shared_host=host)
+    try:
+        assert ep_a.runner is ep_b.runner
+        await ep_a.send_acl(to=bob, performative="inform", content="to-bob")
+        await ep_b.send_acl(to=alice, performative="inform", content="to-alice")
+
+        evt_b = await asyncio.wait_for(ep_b.__anext__(), timeout=1)
+        evt_a = await asyncio.wait_for(ep_a.__anext__(), timeout=1)
+    finally:
+        await ep_a.close()
+        await ep_b.close()
+        await host.close()
+
+    assert (evt_b.acl.content, evt_b.sender.name) == ("to-bob", alice.name)
+    assert (evt_a.acl.content, evt_a.sender.name) == ("to-alice", bob.name)
+
+
+@pytest.mark.asyncio
+async def test_shared_host_starts_once_under_concurrent_endpoints():
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/acc"
+    host = SharedMtpHost(bind_host="127.0.0.1", port=port)
+    alice = AgentIdentifier("alice@localhost/JADE", [url])
+    bob = AgentIdentifier("bob@localhost/JADE", [url])
+
+    ep_a, ep_b = await asyncio.gather(
+        start_endpoint(my_aid=alice, shared_host=host),
+        start_endpoint(my_aid=bob, shared_host=host),
+    )
+    try:
+        assert ep_a.runner is ep_b.runner is host.runner
+    finally:
+        await ep_a.close()
+        await ep_b.close()
+        await host.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_host_full_inbox_holds_reply_until_queued():
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/acc"
+    host = SharedMtpHost(bind_host="127.0.0.1", port=port, max_inbox=1)
+    await host.start()
+    inbox = host.attach("receiver")
+    to_ai = AgentIdentifier("receiver", [url])
+    from_ai = AgentIdentifier("sender@localhost:1/JADE", ["http://127.0.0.1:1/acc"])
+
+    try:
+        async with HttpMtpClient(retries=0) as client:
+            await client.send(to_ai, from_ai, AclMessage("inform", content="a"), url)
+            await asyncio.wait_for(_wait_full(inbox), timeout=1)
+
+            second = asyncio.create_task(
+                client.send(to_ai, from_ai, AclMessage("inform", content="b"), url)
+            )
+            await asyncio.sleep(0.1)
+            assert not second.done()
+
+            _, first = inbox.get_nowait()
+            await asyncio.wait_for(second, timeout=1)
+            _, queued = inbox.get_nowait()
+    finally:
+        await host.close()
+
+    assert (first.content, queued.content) == ("a", "b")
+
+
+@pytest.mark.asyncio
+async def test_large_bodies_are_parsed_in_the_executor():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from peak_acl.transport import build_multipart
+    from peak_acl.transport.http_mtp import OFFLOAD_MIN_SIZE, HttpMtpServer
+
+    class CountingExecutor(ThreadPoolExecutor):
+        submitted = 0
+
+        def submit(self, fn, *args, **kwargs):
+            CountingExecutor.submitted += 1
+            return super().submit(fn, *args, **kwargs)
+
+    to_ai = AgentIdentifier("b", ["http://b"])
+    from_ai = AgentIdentifier("a", ["http://a"])
+    with CountingExecutor(max_workers=1) as executor:
+        server = HttpMtpServer(executor=executor)
+        for content in ("small", "x" * OFFLOAD_MIN_SIZE):
+            body, _ = build_multipart(
+                to_ai, from_ai, AclMessage("inform", content=content), boundary="B"
+            )
+            await server._process_raw(body, b"B")
+            _, acl = server.inbox.get_nowait()
+            assert acl.content == content
+
+    assert CountingExecutor.submitted == 1
@@ -1,3 +1,4 @@
+from dataclasses import asdict, fields
 from datetime import datetime
 
 import pytest
@@ -64,3 +65,32 @@ def test_acl_message_receiver_helpers():
 
     with pytest.raises(KeyError):
         _ = msg["does-not-exist"]
+
+
+def test_normalized_slots_follow_reassignment():
+    msg = AclMessage("inform", protocol="FIPA-Request")
+    assert msg.protocol_lower == "fipa-request"
+    assert msg.ontology_lower == ""
+    assert msg.language_lower == ""
+    assert msg.performative_upper == "INFORM"
+
+    msg.protocol = "Contract-Net"
+    msg.ontology = "Health"
+    msg.performative = "query_ref"
+    msg.language = "FIPA-SL0"
+    assert msg.language_lower == "fipa-sl0"
+    assert msg.protocol_lower == "contract-net"
+    assert msg.ontology_lower == "health"
+    assert msg.performative_upper == "QUERY-REF"
+    assert msg == AclMessage(
+        "query_ref", protocol="Contract-Net", ontology="Health", language="FIPA-SL0"
+    )
+
+
+def test_memo_slots_stay_out_of_dataclass_fields():
+    msg = AclMessage("inform", protocol="FIPA-Request")
+    assert msg.performative_upper == "INFORM" and msg.protocol_lower
+
+    names = {f.name for f in fields(msg)}
+    assert not any(name.startswith("_") for name in names)
+    assert set(asdict(msg)) == names
@@ -22,5 +22,23 @@ def test_envelope_xml_roundtrip():
     assert parsed.from_ == env.from_
     assert parsed.payload_length == env.payload_length
     assert parsed.acl_rep == env.acl_rep
-    diff = abs((parsed.date - env.date).total_seconds())
-    assert diff < 1
+    # JADE dates carry milliseconds: the sub-millisecond part is truncated.
+    assert parsed.date == dt.replace(microsecond=123000)
+
+
+def test_envelope_from_xml_memoizes_fields_but_not_objects():
+    from peak_acl.message import envelope
+
+    envelope._parse_envelope_cached.cache_clear()
+    dt = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    xml = Envelope(
+        AgentIdentifier("bob", ["http://b"]), AgentIdentifier("alice"), dt, 5
+    ).to_xml()
+
+    first = Envelope.from_xml(xml)
+    first.to_.addresses.append("http://mutated")
+    second = Envelope.from_xml(xml)
+
+    assert envelope._parse_envelope_cached.cache_info().hits == 1
+    assert second.to_ == AgentIdentifier("bob", ["http://b"])
+    assert second.to_ is not first.to_
@@ -1,24 +1,96 @@
 import re
 
+import pytest
+
+from peak_acl import transport
 from peak_acl.message import AclMessage, AgentIdentifier, Envelope
 from peak_acl.parser import parse
-from peak_acl.transport import build_multipart
-from peak_acl.transport.http_mtp import _extract_envelope_acl
+from peak_acl.transport.http_mtp import (
+    _extract_envelope_acl,
+    _parse_boundary,
+    _split_parts,
+)
+from peak_acl.transport.multipart import build_multipart
 
+_BOUNDARY_RE = re.compile(rb'boundary="?([^";]+)"?')
+_TO_AI = AgentIdentifier("b", ["http://b"])
+_FROM_AI = AgentIdentifier("a", ["http://a"])
 
-def test_build_multipart_roundtrip():
-    to_ai = AgentIdentifier("b", ["http://b"])
-    from_ai = AgentIdentifier("a", ["http://a"])
-    msg = AclMessage("inform", content="hi")
-    body, ctype = build_multipart(to_ai, from_ai, msg)
 
-    m = re.search(r'boundary="?([^";]+)"?', ctype)
+def test_transport_package_reexports_build_multipart():
+    assert transport.build_multipart is build_multipart
+
+
+@pytest.mark.parametrize("size", [2, 1024, 65536])
+def test_build_multipart_roundtrip(size):
+    content = "x" * size
+    msg = AclMessage("inform", content=content)
+    body, ctype = build_multipart(_TO_AI, _FROM_AI, msg)
+
+    m = _BOUNDARY_RE.search(ctype.encode())
     assert m, "missing boundary"
-    boundary = m.group(1).encode()
+    boundary = m.group(1)
 
     env_xml, acl_txt = _extract_envelope_acl(body, boundary)
     env = Envelope.from_xml(env_xml)
     acl = parse(acl_txt)
 
-    assert env.to_.name == to_ai.name
-    assert acl.content == "hi"
+    assert env.to_.name == _TO_AI.name
+    assert env.payload_length == len(acl_txt.encode())
+    assert acl.content == content
+
+
+def test_build_multipart_reuses_preserialized_acl():
+    msg = AclMessage("inform", content="hi")
+    acl_text = '(inform :content "shared")'
+    body, ctype = build_multipart(_TO_AI, _FROM_AI, msg, acl_text=acl_text)
+
+    boundary = _BOUNDARY_RE.search(ctype.encode()).group(1)
+    env_xml, acl_txt = _extract_envelope_acl(body, boundary)
+
+    assert acl_txt == acl_text
+    assert Envelope.from_xml(env_xml).payload_length == len(acl_text.encode())
+
+
+def test_split_parts_tolerates_lf_breaks_and_missing_headers():
+    raw = (
+        b"\r\n--B\nContent-Type: application/xml\n\n<?xml?><e/>\n"
+        b"--B\r\n(inform)\r\n--B--\r\n"
+    )
+    assert _split_parts(raw, b"B") == [
+        (b"Content-Type: application/xml", b"<?xml?><e/>"),
+        (b"", b"(inform)"),
+    ]
+
+
+def test_build_multipart_accepts_a_fixed_boundary():
+    msg = AclMessage("inform", content="hi")
+
+    body, ctype = build_multipart(_TO_AI, _FROM_AI, msg, boundary="BOUNDARY-fixed")
+    assert ctype == 'multipart/mixed; boundary="BOUNDARY-fixed"'
+    assert body.startswith(b"--BOUNDARY-fixed\r\n")
+    assert body.endswith(b"\r\n--BOUNDARY-fixed--\r\n")
+
+    _, other = build_multipart(_TO_AI, _FROM_AI, msg)
+    assert re.fullmatch(r'multipart/mixed; boundary="BOUNDARY-[0-9a-f]{12}"', other)
+
+
+@pytest.mark.parametrize(
+    "ctype, expected",
+    [
+        ('multipart/mixed; boundary="BOUNDARY-1"', b"BOUNDARY-1"),
+        ("multipart/mixed; boundary=abc; charset=utf-8", b"abc"),
+        ('multipart/mixed; Boundary="Mixed"', b"Mixed"),
+        ("multipart/mixed; boundary=", None),
+        ("text/plain", None),
+    ],
+)
+def test_parse_boundary(ctype, expected):
+    assert _parse_boundary(ctype) == expected
+
+
+def test_parse_boundary_is_memoized():
+    _parse_boundary.cache_clear()
+    ctype = 'multipart/mixed; boundary="JADE-BOUNDARY"'
+    assert _parse_boundary(ctype) is _parse_boundary(ctype)
+    assert _parse_boundary.cache_info().hits == 1
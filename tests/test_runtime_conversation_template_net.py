@@ -6,7 +6,8 @@ import pytest
 from peak_acl.message import AclMessage, AgentIdentifier
 from peak_acl.runtime.conversation import ConversationManager
 from peak_acl.runtime.message_template import MessageTemplate
-from peak_acl.util.net import discover_ip
+from peak_acl.util.async_utils import safe_create_task
+from peak_acl.util.net import discover_ip, invalidate_discover_ip
 
 
 def test_message_template_match_is_case_insensitive():
@@ -30,6 +31,13 @@ def test_message_template_rejects_mismatch():
     assert not template.match(acl)
 
 
+def test_message_template_checks_only_constrained_fields():
+    assert MessageTemplate().match(AclMessage("inform"))
+    only_ontology = MessageTemplate(ontology="onto")
+    assert only_ontology.match(AclMessage("request", ontology="ONTO"))
+    assert not only_ontology.match(AclMessage("request"))
+
+
 @pytest.mark.asyncio
 async def test_conversation_manager_request_agree_inform_flow():
     sent = []
@@ -55,6 +63,7 @@ async def test_conversation_manager_request_agree_inform_flow():
     agree = AclMessage("agree", conversation_id=sent_msg.conversation_id)
     manager.on_message(agree)
     assert not fut.done()
+    assert manager._convs[sent_msg.conversation_id].request_msg is None
 
     inform = AclMessage(
         "inform", conversation_id=sent_msg.conversation_id, content="done"
@@ -107,9 +116,84 @@ async def test_conversation_manager_timeout_sets_exception():
 
     with pytest.raises(asyncio.TimeoutError):
         await fut
+    assert manager._convs == {}
+
+
+@pytest.mark.asyncio
+async def test_conversation_manager_shares_timers_between_requests():
+    async def fake_send(_msg, _url):
+        return None
+
+    sender = AgentIdentifier("sender@host", ["http://sender/acc"])
+    receiver = AgentIdentifier("receiver@host", ["http://receiver/acc"])
+    manager = ConversationManager(fake_send)
+
+    futs = [
+        await manager.send_request(
+            sender=sender, receiver=receiver, content="x", timeout=0.05
+        )
+        for _ in range(3)
+    ]
+    assert len(manager._timeouts) <= 2  # may straddle a bucket boundary
+    assert sum(map(len, manager._timeouts.values())) == 3
+
+    for fut in futs:
+        with pytest.raises(asyncio.TimeoutError):
+            await fut
+    assert manager._timeouts == {} and manager._convs == {}
+
+
+@pytest.mark.asyncio
+async def test_conversation_manager_drops_cancelled_conversation_on_reply():
+    async def fake_send(_msg, _url):
+        return None
+
+    sender = AgentIdentifier("sender@host", ["http://sender/acc"])
+    receiver = AgentIdentifier("receiver@host", ["http://receiver/acc"])
+    manager = ConversationManager(fake_send)
+
+    fut = await manager.send_request(
+        sender=sender, receiver=receiver, content="x", url="http://receiver/acc"
+    )
+    conv_id = next(iter(manager._convs.keys()))
+    fut.cancel()
+
+    manager.on_message(AclMessage("agree", conversation_id=conv_id))
+    assert conv_id not in manager._convs
+
+
+@pytest.mark.asyncio
+async def test_conversation_manager_drops_cancelled_conversation_without_reply():
+    async def fake_send(_msg, _url):
+        return None
+
+    sender = AgentIdentifier("sender@host", ["http://sender/acc"])
+    receiver = AgentIdentifier("receiver@host", ["http://receiver/acc"])
+    manager = ConversationManager(fake_send)
+
+    fut = await manager.send_request(
+        sender=sender, receiver=receiver, content="x", url="http://receiver/acc"
+    )
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(fut, timeout=0.01)
+    await asyncio.sleep(0)
+    assert manager._convs == {}
+
+
+@pytest.fixture
+def _fresh_ip_cache():
+    invalidate_discover_ip()
+    yield
+    invalidate_discover_ip()
 
 
 class _BrokenSocket:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.close()
+
     def connect(self, _target):
         raise OSError("offline")
 
@@ -120,6 +204,7 @@ class _BrokenSocket:
         return None
 
 
+@pytest.mark.usefixtures("_fresh_ip_cache")
 def test_discover_ip_falls_back_to_hostname(monkeypatch):
     monkeypatch.setattr(socket, "socket", lambda *_args, **_kwargs: _BrokenSocket())
     monkeypatch.setattr(socket, "gethostname", lambda: "local")
@@ -128,6 +213,7 @@ def test_discover_ip_falls_back_to_hostname(monkeypatch):
     assert discover_ip() == "10.1.2.3"
 
 
+@pytest.mark.usefixtures("_fresh_ip_cache")
 def test_discover_ip_falls_back_to_loopback(monkeypatch):
     monkeypatch.setattr(socket, "socket", lambda *_args, **_kwargs: _BrokenSocket())
     monkeypatch.setattr(socket, "gethostname", lambda: "local")
@@ -138,3 +224,56 @@ def test_discover_ip_falls_back_to_loopback(monkeypatch):
     monkeypatch.setattr(socket, "gethostbyname", _boom)
 
     assert discover_ip() == "127.0.0.1"
+
+
+@pytest.mark.usefixtures("_fresh_ip_cache")
+def test_discover_ip_is_computed_once(monkeypatch):
+    created = []
+
+    def _socket(*_args, **_kwargs):
+        created.append(1)
+        return _BrokenSocket()
+
+    monkeypatch.setattr(socket, "socket", _socket)
+    monkeypatch.setattr(socket, "gethostbyname", lambda _host: "10.1.2.3")
+
+    assert discover_ip() == discover_ip() == "10.1.2.3"
+    assert len(created) == 1
+
+    invalidate_discover_ip()
+    monkeypatch.setattr(socket, "gethostbyname", lambda _host: "10.9.9.9")
+    assert discover_ip() == "10.9.9.9"
+    assert len(created) == 2
+
+
+@pytest.mark.usefixtures("_fresh_ip_cache")
+def test_discover_ip_does_not_cache_loopback_fallback(monkeypatch):
+    monkeypatch.setattr(socket, "socket", lambda *_args, **_kwargs: _BrokenSocket())
+    monkeypatch.setattr(socket, "gethostbyname", lambda _host: "127.0.0.1")
+    assert discover_ip() == "127.0.0.1"
+
+    monkeypatch.setattr(socket, "gethostbyname", lambda _host: "10.1.2.3")
+    assert discover_ip() == "10.1.2.3"
+
+
+@pytest.mark.asyncio
+async def test_safe_create_task_logs_failures_by_task_name(caplog):
+    async def _fail():
+        raise RuntimeError("boom")
+
+    async def _sleep():
+        await asyncio.sleep(10)
+
+    failing = safe_create_task(_fail(), name="worker")
+    unnamed = safe_create_task(_fail())
+    cancelled = safe_create_task(_sleep())
+    cancelled.cancel()
+    with caplog.at_level("ERROR", logger="peak_acl.async_utils"):
+        await asyncio.wait([failing, unnamed, cancelled])
+        await asyncio.sleep(0)
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert messages[0] == "Background task worker failed"
+    # Unnamed tasks are reported by coroutine, not by "Task-N"
+    assert "_fail" in messages[1] and "Task-" not in messages[1]
+    assert len(messages) == 2
@@ -9,6 +9,14 @@ from peak_acl.runtime.dispatcher import InboundDispatcher
 from peak_acl.runtime.message_template import MessageTemplate
 from peak_acl.runtime.router import classify_message
 from peak_acl.sl import sl0
+from peak_acl.sl.sl_visitor import SLSentence, SLString
+
+
+@pytest.fixture(autouse=True)
+def _fresh_decode_cache():
+    content._read_sl.cache_clear()
+    yield
+    content._read_sl.cache_clear()
 
 
 def test_decode_content_non_sl_and_bad_format_passthrough():
@@ -20,28 +28,126 @@ def test_decode_content_non_sl_and_bad_format_passthrough():
     assert content.decode_content(bad_shape) == "not-parenthesized"
 
 
-def test_decode_content_prefers_full_parser_then_falls_back(monkeypatch):
-    msg = AclMessage("inform", content="(ok)", language="fipa-sl0")
+def _reject(_txt):
+    raise ValueError("rejected")
+
+
+def test_decode_content_keeps_sl0_lists_for_other_heads():
+    msg = AclMessage("inform", content="(price :amount 10)", language="fipa-sl")
+    assert content.decode_content(msg) == ["price", ":amount", "10"]
+
+
+def test_decode_content_sl_prefers_full_parser_then_falls_back():
+    msg = AclMessage("inform", content='(ok :x "y")', language="fipa-sl0")
+    assert content.decode_content_sl(msg) == SLSentence("ok", (("x", SLString("y")),))
+
+    bare = AclMessage("inform", content="(inform :content bare)", language="fipa-sl0")
+    assert content.decode_content_sl(bare) == ["inform", ":content", "bare"]
+    plain = AclMessage("inform", content='(ok :x "y")', language="plain")
+    assert content.decode_content_sl(plain) == '(ok :x "y")'
+
+
+def test_decode_content_sl_sends_sl0_vocabulary_straight_to_sl0(monkeypatch):
+    def _no_full_parse(_txt):
+        raise AssertionError("the full SL parser should not run for SL0 forms")
+
+    monkeypatch.setattr(content, "try_parse_fast", _no_full_parse)
+    done = AclMessage("inform", content="((DONE (action df x)))", language="fipa-sl0")
+    decoded = content.decode_content_sl(done)
+
+    assert isinstance(decoded, list) and isinstance(decoded[0], sl0.Done)
+
+
+def test_decode_content_memoizes_repeated_bodies():
+    first = content.decode_content(
+        AclMessage("inform", content="(done x)", language="fipa-sl0")
+    )
+    again = content.decode_content(
+        AclMessage("inform", content=" (done x) ", language="fipa-sl")
+    )
+
+    assert first == sl0.Done("x")
+    assert again == first and again is not first
+    assert content._read_sl.cache_info().hits == 1
+
+
+def test_decode_content_hands_each_message_its_own_objects():
+    def decode(body):
+        msg = AclMessage("inform", content=body, language="fipa-sl")
+        return content.decode_content(msg)
 
-    monkeypatch.setattr(content, "parse", lambda txt: {"tree": txt})
-    monkeypatch.setattr(content, "build_ast", lambda tree: ("ast", tree["tree"]))
-    assert content.decode_content(msg) == ("ast", "(ok)")
+    body = (
+        "((done (action df (search "
+        "(df-agent-description :name (agent-identifier :name a))))))"
+    )
+    decode(body)[0].what.act.template.name.addresses.append("http://mutated")
+    assert decode(body)[0].what.act.template.name.addresses == []
+    assert content._read_sl.cache_info().hits == 1
+
+    decode("(price :amount (x 10))")[2].append("mutated")
+    assert decode("(price :amount (x 10))") == ["price", ":amount", ["x", "10"]]
+
+
+def test_decode_content_does_not_memoize_large_bodies():
+    body = "(x " + "a " * content.DECODE_CACHE_MAX_TEXT + ")"
+    for _ in range(2):
+        msg = AclMessage("inform", content=body, language="fipa-sl")
+        assert len(content.decode_content(msg)) == content.DECODE_CACHE_MAX_TEXT + 1
+
+    assert content._read_sl.cache_info().currsize == 0
 
-    monkeypatch.setattr(content, "parse", lambda _txt: (_ for _ in ()).throw(ValueError("boom")))
-    monkeypatch.setattr(content.sl0, "loads", lambda txt: ("sl0", txt))
-    assert content.decode_content(msg) == ("sl0", "(ok)")
+
+def test_decode_content_keeps_result_on_the_message():
+    msg = AclMessage("inform", content="(done x)", language="fipa-sl0")
+    first = content.decode_content(msg)
+    assert content.decode_content(msg) is first
+    assert content._read_sl.cache_info().misses == 1
+    assert content._read_sl.cache_info().hits == 0
+
+    msg.content = "(done y)"
+    assert content.decode_content(msg) == sl0.Done("y")
+    msg.language = "plain"
+    assert content.decode_content(msg) == "(done y)"
 
 
 def test_decode_content_returns_raw_when_all_decoders_fail(monkeypatch):
     msg = AclMessage("inform", content="(x)", language="fipa-sl0")
-    monkeypatch.setattr(content, "parse", lambda _txt: (_ for _ in ()).throw(RuntimeError("bad")))
-    monkeypatch.setattr(content.sl0, "loads", lambda _txt: (_ for _ in ()).throw(RuntimeError("bad2")))
+    monkeypatch.setattr(content.sl0, "parse_sexpr", _reject)
 
     assert content.decode_content(msg) == "(x)"
 
 
+def test_try_decode_content_reports_errors_instead_of_raising(monkeypatch):
+    msg = AclMessage("inform", content="(done x)", language="fipa-sl0")
+    assert content.try_decode_content(msg) == (True, sl0.Done("x"))
+
+    def _boom(_clean):
+        raise RecursionError("too deep")
+
+    monkeypatch.setattr(content, "_decode_sl", _boom)
+    ok, err = content.try_decode_content(
+        AclMessage("inform", content="(y)", language="fipa-sl0")
+    )
+    assert ok is False and isinstance(err, RecursionError)
+
+
+class _TaskRecorder:
+    """Stands in for ``create_task`` of the loop the dispatcher runs on."""
+
+    def __init__(self, close=False):
+        self.scheduled = []
+        self._close = close
+
+    def create_task(self, coro):
+        self.scheduled.append(coro)
+        if self._close:
+            coro.close()
+
+
 @pytest.mark.asyncio
-async def test_inbound_dispatcher_matches_first_rule_and_schedules_callback(monkeypatch):
+async def test_inbound_dispatcher_matches_first_rule_and_schedules_callback(
+    monkeypatch,
+):
     dispatcher = InboundDispatcher()
     sender = AgentIdentifier("alice")
     acl = AclMessage("inform", content="hi")
@@ -51,17 +157,15 @@ async def test_inbound_dispatcher_matches_first_rule_and_schedules_callback(monk
     async def cb(_sender, _acl):
         calls.append((_sender.name, _acl.content))
 
-    scheduled = []
-
-    def fake_create_task(coro):
-        scheduled.append(coro)
-
-    monkeypatch.setattr(asyncio, "create_task", fake_create_task)
+    recorder = _TaskRecorder()
+    scheduled = recorder.scheduled
 
     dispatcher.add(MessageTemplate(performative="request"), cb)
     dispatcher.add(MessageTemplate(performative="inform"), cb)
 
-    matched = await dispatcher.dispatch(sender, acl)
+    with monkeypatch.context() as m:
+        m.setattr(asyncio.get_running_loop(), "create_task", recorder.create_task)
+        matched = await dispatcher.dispatch(sender, acl)
     assert matched is True
     assert len(scheduled) == 1
 
@@ -69,6 +173,67 @@ async def test_inbound_dispatcher_matches_first_rule_and_schedules_callback(monk
     assert calls == [("alice", "hi")]
 
 
+@pytest.mark.asyncio
+async def test_inbound_dispatcher_keeps_registration_order_across_key_shapes(
+    monkeypatch,
+):
+
+    async def generic(_s, _m):
+        pass
+
+    async def specific(_s, _m):
+        pass
+
+    dispatcher = InboundDispatcher()
+    recorder = _TaskRecorder(close=True)
+    scheduled = recorder.scheduled
+    dispatcher.add(MessageTemplate(protocol="fipa-request"), generic)
+    dispatcher.add(
+        MessageTemplate(performative="request", protocol="FIPA-Request"), specific
+    )
+    dispatcher.add(MessageTemplate(performative="inform", ontology="onto"), specific)
+
+    with monkeypatch.context() as m:
+        m.setattr(asyncio.get_running_loop(), "create_task", recorder.create_task)
+        request = AclMessage("request", protocol="fipa-request")
+        assert await dispatcher.dispatch(AgentIdentifier("a"), request) is True
+        assert scheduled[-1].cr_code is generic.__code__
+
+        inform = AclMessage("inform", ontology="ONTO")
+        assert await dispatcher.dispatch(AgentIdentifier("a"), inform) is True
+        assert scheduled[-1].cr_code is specific.__code__
+
+    other = AclMessage("inform", ontology="other")
+    assert await dispatcher.dispatch(AgentIdentifier("a"), other) is False
+
+
+def test_inbound_dispatcher_survives_a_new_event_loop():
+    calls = []
+
+    async def cb(_sender, acl):
+        calls.append(acl.content)
+
+    dispatcher = InboundDispatcher()
+    dispatcher.add(MessageTemplate(performative="inform"), cb)
+
+    async def run(txt):
+        msg = AclMessage("inform", content=txt)
+        assert await dispatcher.dispatch(AgentIdentifier("a"), msg)
+        await asyncio.sleep(0)
+
+    asyncio.run(run("first"))
+    asyncio.run(run("second"))
+
+    # A different loop while the first one is still open
+    other = asyncio.new_event_loop()
+    try:
+        other.run_until_complete(run("third"))
+        asyncio.run(run("fourth"))
+    finally:
+        other.close()
+    assert calls == ["first", "second", "third", "fourth"]
+
+
 @pytest.mark.asyncio
 async def test_inbound_dispatcher_returns_false_when_no_rule_matches():
     dispatcher = InboundDispatcher()
@@ -120,3 +285,51 @@ def test_classify_message_df_and_external_paths(monkeypatch):
 
     plain = AclMessage("inform")
     assert classify_message(env_ext, plain, df) == ("ext-raw", None)
+
+
+def test_classify_message_survives_deeply_nested_df_replies():
+    df = AgentIdentifier("df")
+    env = Envelope(
+        to_=AgentIdentifier("me"),
+        from_=df,
+        date=datetime.now(timezone.utc),
+        payload_length=0,
+    )
+    depth = 3000
+    nested = "(x " * depth + ")" * depth
+
+    done = AclMessage("inform", content=f"((done {nested}))", language="fipa-sl0")
+    kind, payload = classify_message(env, done, df)
+    assert kind == "df-done" and isinstance(payload, sl0.Done)
+
+    sentence = AclMessage("inform", content=f"(foo :a {nested})", language="fipa-sl")
+    assert classify_message(env, sentence, df)[0] == "df-result"  # sl0 list
+
+    # Rendering the nested name exhausts the recursion limit: kept as raw text
+    raw = f"(agent-identifier :name {nested})"
+    bad = AclMessage("inform", content=raw, language="fipa-sl0")
+    assert classify_message(env, bad, df) == ("df", raw)
+
+
+@pytest.mark.asyncio
+async def test_decode_content_async_offloads_only_large_payloads(monkeypatch):
+    small = AclMessage("inform", content="(done x)", language="fipa-sl0")
+    assert await content.decode_content_async(small) == sl0.Done("x")
+
+    offloaded = []
+    loop = asyncio.get_running_loop()
+    real_run = loop.run_in_executor
+
+    def fake_run(executor, fn, *args):
+        offloaded.append(fn)
+        return real_run(executor, fn, *args)
+
+    monkeypatch.setattr(loop, "run_in_executor", fake_run)
+    big = AclMessage(
+        "inform",
+        content="(done " + "x" * content.OFFLOAD_MIN_SIZE + ")",
+        language="fipa-sl0",
+    )
+    decoded = await content.decode_content_async(big)
+    assert isinstance(decoded, sl0.Done)
+    assert offloaded == [content.decode_content]
@@ -7,7 +7,12 @@ from peak_acl.message.acl import AclMessage
 from peak_acl.message.aid import AgentIdentifier
 from peak_acl.message.envelope import Envelope
 from peak_acl.runtime import event
-from peak_acl.runtime.runtime import CommEndpoint, _first_url, start_endpoint
+from peak_acl.runtime.runtime import (
+    MAX_EVENTS,
+    CommEndpoint,
+    _first_url,
+    start_endpoint,
+)
 from peak_acl.sl import sl0
 
 
@@ -24,7 +29,7 @@ class DummyClient:
         self.sent = []
         self.closed = False
 
-    async def send(self, to_ai, from_ai, msg, url):
+    async def send(self, to_ai, from_ai, msg, url, **kw):
         self.sent.append((to_ai, from_ai, msg, url))
 
     async def close(self):
@@ -103,6 +108,31 @@ async def test_comm_endpoint_errors_and_close():
     assert client.closed is True
 
 
+@pytest.mark.asyncio
+async def test_send_acl_posts_to_receivers_concurrently():
+    my = AgentIdentifier("me", ["http://me/acc"])
+    receivers = [AgentIdentifier(n, [f"http://{n}/acc"]) for n in ("a", "b")]
+    both_started = asyncio.Event()
+    started = []
+
+    class BlockingClient(DummyClient):
+        async def send(self, to_ai, from_ai, msg, url, **kw):
+            started.append(to_ai.name)
+            if len(started) == len(receivers):
+                both_started.set()
+            await both_started.wait()  # deadlocks if sends are serialized
+
+    client = BlockingClient()
+    ep = CommEndpoint(
+        my, asyncio.Queue(), client, DummyServer(), DummyRunner(), object(), None
+    )
+    msg = await asyncio.wait_for(
+        ep.send_acl(to=receivers, performative="inform", content="hi"), timeout=1
+    )
+    assert started == ["a", "b"]
+    assert msg.receivers == receivers and msg.receivers is not receivers
+
+
 def test_first_url_requires_address():
     with pytest.raises(ValueError):
         _first_url(AgentIdentifier("x"))
@@ -140,6 +170,51 @@ async def test_pump_dispatch_classify_and_iteration(monkeypatch):
         await pump_task
 
 
+@pytest.mark.asyncio
+async def test_pump_drops_oldest_event_when_events_are_full(monkeypatch, caplog):
+    my = AgentIdentifier("me", ["http://me/acc"])
+    sender = AgentIdentifier("sender", ["http://sender/acc"])
+    env = Envelope(
+        to_=my, from_=sender, date=datetime.now(timezone.utc), payload_length=0
+    )
+    ep = CommEndpoint(
+        my,
+        asyncio.Queue(),
+        DummyClient(),
+        DummyServer(),
+        DummyRunner(),
+        object(),
+        None,
+        _events=asyncio.Queue(maxsize=1),
+    )
+
+    async def dispatch(_s, _m):
+        return False
+
+    ep.dispatcher.dispatch = dispatch
+    monkeypatch.setattr(
+        "peak_acl.runtime.runtime.router.classify_message",
+        lambda _env, acl, _df: ("ext-raw", acl.content),
+    )
+    for txt in ("a", "b", "c"):
+        ep.inbox.put_nowait((env, AclMessage("inform", content=txt)))
+
+    with caplog.at_level("DEBUG", logger="peak_acl.runtime"):
+        pump_task = asyncio.create_task(ep._pump())
+        while not ep.inbox.empty():
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
+
+    # The pump kept going without a consumer; only the newest event is left
+    assert ep._events.qsize() == 1
+    assert (await asyncio.wait_for(ep.__anext__(), timeout=1)).payload == "c"
+    # Reported once at INFO; later drops only at DEBUG
+    assert [r.levelname for r in caplog.records] == ["INFO", "DEBUG"]
+    pump_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await pump_task
+
+
 @pytest.mark.asyncio
 async def test_start_endpoint_auto_register_and_validation(monkeypatch):
     my = AgentIdentifier("me", ["http://127.0.0.1:8080/acc"])
@@ -152,8 +227,10 @@ async def test_start_endpoint_auto_register_and_validation(monkeypatch):
         assert kwargs["port"] == 8080
         return server, runner, object()
 
+    registered = []
+
     async def fake_register(self, df_aid, services, **kwargs):
-        self._registered = (df_aid, list(services), kwargs["df_url"])
+        registered.append((df_aid, list(services), kwargs["df_url"]))
 
     monkeypatch.setattr("peak_acl.runtime.runtime.start_server", fake_start_server)
     monkeypatch.setattr(CommEndpoint, "register_df", fake_register)
@@ -165,8 +242,9 @@ async def test_start_endpoint_auto_register_and_validation(monkeypatch):
         services=[("svc", "type")],
         http_client=client,
     )
-    assert ep._registered[0].name == "df"
-    assert ep._registered[2] == "http://df/acc"
+    assert registered[0][0].name == "df"
+    assert registered[0][2] == "http://df/acc"
+    assert ep._events.maxsize == MAX_EVENTS
 
     await ep.close()
 
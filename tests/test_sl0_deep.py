@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 from peak_acl.message.aid import AgentIdentifier
@@ -83,6 +85,12 @@ def test_sl0_build_ast_fallback_and_errors():
         sl0._build_dfad("bad")
 
 
+def test_sl0_try_loads_returns_none_on_malformed_input():
+    assert sl0.try_loads("(done x)") == sl0.Done("x")
+    assert sl0.try_loads("(done x") is None
+    assert sl0.try_loads("(done x) extra") is None
+
+
 def test_sl0_extract_properties_and_services():
     props = sl0._extract_properties(
         [
@@ -101,3 +109,32 @@ def test_sl0_extract_properties_and_services():
     )
     assert services[0].name == "svc"
     assert services[0].type == "kind"
+
+
+def test_sl0_tokenize_strings_escapes_and_atoms():
+    toks = list(sl0._tokenize('(a "b c" "x\\"y" ""  d"e "open'))
+    assert toks == ["(", "a", '"b c"', '"x"y"', '""', 'd"e', '"open"']
+
+
+def test_sl0_parse_expr_is_not_bounded_by_recursion_limit():
+    depth = sys.getrecursionlimit() * 2
+    toks = ["("] * depth + ['"x"'] + [")"] * depth
+    expr, pos = sl0._parse_expr(toks, 0)
+    assert pos == len(toks)
+    for _ in range(depth):
+        (expr,) = expr
+    assert expr == "x"
+
+    with pytest.raises(ValueError, match="não fechado"):
+        sl0._parse_expr(["(", "a"], 0)
+    with pytest.raises(ValueError, match="inesperado"):
+        sl0._parse_expr([")"], 0)
+
+
+def test_sl0_build_ast_is_not_bounded_by_recursion_limit():
+    depth = sys.getrecursionlimit() * 2
+    parsed = sl0.loads("(done " * depth + "x" + ")" * depth)
+    for _ in range(depth):
+        assert isinstance(parsed, sl0.Done)
+        parsed = parsed.what
+    assert parsed == "x"
@@ -1,6 +1,7 @@
 import pytest
 
 from peak_acl.sl import sl0, sl_parser, sl_visitor
+from peak_acl.sl.sl_parser_fast import parse_fast, try_parse_fast
 
 
 def test_sl_parser_known_limitations_and_dumps_fallback():
@@ -131,7 +132,7 @@ def test_ast_builder_visit_msg_function_action_and_build_ast(monkeypatch):
     monkeypatch.setattr(builder, "visit", lambda x: ("visited", x))
     msg = builder.visitMsg(Msg())
     assert msg.performative == "inform"
-    assert msg.slots == [("visited", "slot-a"), ("visited", "slot-b")]
+    assert msg.slots == (("visited", "slot-a"), ("visited", "slot-b"))
 
     class Lit:
         def __init__(self, t):
@@ -165,7 +166,7 @@ def test_ast_builder_visit_msg_function_action_and_build_ast(monkeypatch):
 
     fn = builder.visitFunctionExpr(Fn())
     assert fn.name == "sum"
-    assert fn.args == [("visited", "a"), ("visited", "b")]
+    assert fn.args == (("visited", "a"), ("visited", "b"))
 
     action = builder.visitActionExpr(Act())
     assert action.actor == ("visited", "actor")
@@ -207,3 +208,28 @@ def test_ast_builder_visit_term_branches(kind, monkeypatch):
 
     monkeypatch.setattr(builder, "visit", lambda node: ("term", node))
     assert builder.visitTerm(TermCtx(kind))[0] == "term"
+
+
+def test_parse_fast_builds_ast_directly():
+    text = '(request :content (action "df" (search ?x -1.5)) :note "a \\"b\\"")'
+    assert parse_fast(text) == sl_visitor.SLSentence(
+        "request",
+        (
+            (
+                "content",
+                sl_visitor.SLAction(
+                    sl_visitor.SLString("df"),
+                    sl_visitor.SLFunc(
+                        "search", (sl_visitor.SLVar("?x"), sl_visitor.SLNumber(-1.5))
+                    ),
+                ),
+            ),
+            ("note", sl_visitor.SLString('a "b"')),  # unescaped, as in sl0
+        ),
+    )
+    assert parse_fast("(inform)") == sl_visitor.SLSentence("inform")
+
+    for bad in ("(inform :content bare)", '(inform "x")', "(inform) x", '(a :b "c', ""):
+        assert try_parse_fast(bad) is None
+    with pytest.raises(ValueError):
+        parse_fast("(inform :content")
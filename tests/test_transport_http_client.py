@@ -101,3 +101,27 @@ async def test_http_client_context_manager():
     async with client as cm:
         assert cm is client
     assert session.closed is True
+
+
+@pytest.mark.asyncio
+async def test_http_client_owned_session_pool_settings():
+    client = HttpMtpClient(limit=8, limit_per_host=2, keepalive_timeout=5.0)
+    try:
+        connector = client.session.connector
+        assert connector.limit == 8
+        assert connector.limit_per_host == 2
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_http_client_keeps_aiohttp_keepalive_default():
+    client = HttpMtpClient()
+    reference = aiohttp.TCPConnector()
+    try:
+        assert (
+            client.session.connector._keepalive_timeout == reference._keepalive_timeout
+        )
+    finally:
+        await client.close()
+        await reference.close()